@@ -8,13 +8,15 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from app.main import app as main_app
+from app.main import app as main_app, lifespan
 
 # Create FastAPI app for Vercel
 app = FastAPI(
     title="Resume Relevance API",
     description="Complete resume evaluation system API",
-    version="1.0.0"
+    version="1.0.0",
+    # Mounted apps get no lifespan events, so the outer app runs main_app's
+    lifespan=lifespan
 )
 
 # Enable CORS
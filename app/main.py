@@ -1,8 +1,13 @@
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from sqlmodel import Session, create_engine, select
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.encoders import jsonable_encoder
+from sqlmodel import Session, create_engine, select, func
 from pathlib import Path
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 import os
 from typing import List, Optional
 import json
@@ -32,7 +37,32 @@ else:
 engine = create_engine(DATABASE_URL, echo=False)
 SQLModel.metadata.create_all(engine)
 
-app = FastAPI(title="Resume Relevance Check System", description="AI-powered resume evaluation platform")
+# orjson encodes the list endpoints much faster than the stdlib json module
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+    
+    def ndjson_line(row):
+        return orjson.dumps(row) + b"\n"
+except ImportError:
+    DefaultResponse = JSONResponse
+    
+    def ndjson_line(row):
+        return (json.dumps(jsonable_encoder(row)) + "\n").encode()
+
+@asynccontextmanager
+async def lifespan(app):
+    """Raise AnyIO's worker limit; every endpoint here is a sync def run in the threadpool"""
+    import anyio.to_thread
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+    yield
+
+app = FastAPI(
+    title="Resume Relevance Check System",
+    description="AI-powered resume evaluation platform",
+    default_response_class=DefaultResponse,
+    lifespan=lifespan
+)
 
 # Enable CORS for Streamlit
 app.add_middleware(
@@ -43,6 +73,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# List endpoints return repetitive JSON that compresses well; tiny responses are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 @app.get("/")
 def root():
     """Root endpoint with system information"""
@@ -78,6 +111,68 @@ def health_check():
     """Health check endpoint for monitoring"""
     return {"status": "healthy", "service": "resume-relevance-api"}
 
+SCORE_BIN_WIDTH = 5
+SCORE_BIN_COUNT = 100 // SCORE_BIN_WIDTH
+
+@app.get("/api/dashboard-summary")
+def dashboard_summary():
+    """Everything the dashboard shows in one call: counts, average, score histogram and recent evaluations"""
+    with Session(engine) as session:
+        average = session.exec(select(func.avg(Evaluation.final_score))).one()
+        
+        # Integer division buckets the 0-100 scores; a perfect 100 joins the top bin
+        bucket = Evaluation.final_score // SCORE_BIN_WIDTH
+        score_bins = [0] * SCORE_BIN_COUNT
+        for index, count in session.exec(select(bucket, func.count()).group_by(bucket)).all():
+            score_bins[min(max(int(index), 0), SCORE_BIN_COUNT - 1)] += count
+        
+        recent = session.exec(
+            select(Evaluation, Candidate.name, Job.title)
+            .outerjoin(Resume, Resume.id == Evaluation.resume_id)
+            .outerjoin(Candidate, Candidate.id == Resume.candidate_id)
+            .outerjoin(Job, Job.id == Evaluation.job_id)
+            .order_by(Evaluation.eval_time.desc())
+            .limit(10)
+        ).all()
+        
+        return {
+            "jobs": session.exec(select(func.count()).select_from(Job)).one(),
+            "resumes": session.exec(select(func.count()).select_from(Resume)).one(),
+            "evaluations": session.exec(select(func.count()).select_from(Evaluation)).one(),
+            "average_score": float(average) if average is not None else None,
+            "score_bin_width": SCORE_BIN_WIDTH,
+            "score_bins": score_bins,
+            "recent": [{
+                "candidate_name": candidate_name or "Unknown",
+                "job_title": job_title or "Unknown",
+                "final_score": ev.final_score,
+                "verdict": ev.verdict,
+                "eval_time": ev.eval_time
+            } for ev, candidate_name, job_title in recent]
+        }
+
+@app.get("/api/analytics/job-score-means")
+def job_score_means():
+    """Average final score per job title, aggregated in SQL"""
+    with Session(engine) as session:
+        title = func.coalesce(Job.title, "Unknown")
+        average = func.avg(Evaluation.final_score)
+        rows = session.exec(
+            select(title, average)
+            .select_from(Evaluation)
+            .outerjoin(Job, Job.id == Evaluation.job_id)
+            .group_by(title)
+            .order_by(average.desc())
+        ).all()
+        return [{"job_title": job_title, "avg_score": float(avg_score)} for job_title, avg_score in rows]
+
+@app.get("/api/analytics/verdict-counts")
+def verdict_counts():
+    """Number of evaluations per verdict, aggregated in SQL"""
+    with Session(engine) as session:
+        rows = session.exec(select(Evaluation.verdict, func.count()).group_by(Evaluation.verdict)).all()
+        return {verdict: count for verdict, count in rows}
+
 @app.post("/api/jobs")
 def add_job(title: str = Form(...), jd_text: str = Form(...), must_have: str = Form(""), nice_to_have: str = Form("")):
     """Create a new job posting with enhanced parsing"""
@@ -266,26 +361,30 @@ def list_jobs(skip: int = Query(0), limit: int = Query(10)):
         return [{"id": job.id, "title": job.title, "location": job.location, "must_have": job.must_have} for job in jobs]
 
 @app.get("/api/resumes")
-def list_resumes(skip: int = Query(0), limit: int = Query(10)):
-    """List all resumes with pagination"""
+def list_resumes(skip: int = Query(0), limit: int = Query(10), fields: Optional[str] = Query(None)):
+    """List all resumes with pagination; `fields` (comma separated) limits the returned columns"""
+    wanted = set(fields.split(",")) if fields else None
     with Session(engine) as session:
         resumes = session.exec(select(Resume).offset(skip).limit(limit)).all()
         candidates = {}
-        for resume in resumes:
-            if resume.candidate_id and resume.candidate_id not in candidates:
-                candidate = session.get(Candidate, resume.candidate_id)
-                candidates[resume.candidate_id] = candidate
+        if wanted is None or not wanted.isdisjoint(("candidate_name", "candidate_email")):
+            for resume in resumes:
+                if resume.candidate_id and resume.candidate_id not in candidates:
+                    candidate = session.get(Candidate, resume.candidate_id)
+                    candidates[resume.candidate_id] = candidate
         
-        return [{
+        rows = [{
             "id": resume.id,
             "candidate_name": candidates.get(resume.candidate_id).name if resume.candidate_id and candidates.get(resume.candidate_id) else "Unknown",
             "candidate_email": candidates.get(resume.candidate_id).email if resume.candidate_id and candidates.get(resume.candidate_id) else "Unknown",
             "uploaded_at": resume.uploaded_at
         } for resume in resumes]
+        return rows if wanted is None else [{k: v for k, v in row.items() if k in wanted} for row in rows]
 
 @app.get("/api/evaluations")
-def list_evaluations(job_id: Optional[int] = Query(None), verdict: Optional[str] = Query(None), skip: int = Query(0), limit: int = Query(20)):
-    """List evaluations with filtering options"""
+def list_evaluations(job_id: Optional[int] = Query(None), verdict: Optional[str] = Query(None), skip: int = Query(0), limit: int = Query(20), fields: Optional[str] = Query(None)):
+    """List evaluations with filtering options; `fields` (comma separated) limits the returned columns"""
+    wanted = set(fields.split(",")) if fields else None
     with Session(engine) as session:
         query = select(Evaluation)
         
@@ -296,14 +395,16 @@ def list_evaluations(job_id: Optional[int] = Query(None), verdict: Optional[str]
             
         evaluations = session.exec(query.offset(skip).limit(limit)).all()
         
-        # Get related data
+        # Get related data, skipping lookups for columns that were not requested
+        need_candidate = wanted is None or "candidate_name" in wanted
+        need_job = wanted is None or "job_title" in wanted
         result = []
         for ev in evaluations:
-            resume = session.get(Resume, ev.resume_id)
-            job = session.get(Job, ev.job_id)
+            resume = session.get(Resume, ev.resume_id) if need_candidate else None
+            job = session.get(Job, ev.job_id) if need_job else None
             candidate = session.get(Candidate, resume.candidate_id) if resume and resume.candidate_id else None
             
-            result.append({
+            row = {
                 "id": ev.id,
                 "final_score": ev.final_score,
                 "verdict": ev.verdict,
@@ -311,13 +412,69 @@ def list_evaluations(job_id: Optional[int] = Query(None), verdict: Optional[str]
                 "job_title": job.title if job else "Unknown",
                 "eval_time": ev.eval_time,
                 "missing_skills": ev.missing_skills
-            })
+            }
+            result.append(row if wanted is None else {k: v for k, v in row.items() if k in wanted})
             
         return result
 
+# Bulk evaluation overlaps the per-resume embedding calls. An in-memory SQLite
+# database is per-thread, so there it runs inline on the request thread instead.
+BULK_EVAL_WORKERS = 8
+IN_MEMORY_DB = DATABASE_URL.endswith(":memory:")
+
+def evaluate_for_bulk(resume_id: int, job_id: int):
+    """One bulk row: the evaluation summary, or the error that stopped it"""
+    try:
+        eval_result = evaluate(resume_id=resume_id, job_id=job_id)
+        return {
+            "resume_id": resume_id,
+            "evaluation_id": eval_result["evaluation_id"],
+            "score": eval_result["final_score"],
+            "verdict": eval_result["verdict"]
+        }
+    except Exception as e:
+        return {
+            "resume_id": resume_id,
+            "error": str(e)
+        }
+
+@app.get("/api/evaluations/stream")
+def stream_evaluations(job_id: Optional[int] = Query(None), verdict: Optional[str] = Query(None), skip: int = Query(0), limit: int = Query(200)):
+    """Evaluations as NDJSON, one row per line, sent while the query is still being read"""
+    query = (
+        select(Evaluation, Candidate.name, Job.title)
+        .outerjoin(Resume, Resume.id == Evaluation.resume_id)
+        .outerjoin(Candidate, Candidate.id == Resume.candidate_id)
+        .outerjoin(Job, Job.id == Evaluation.job_id)
+    )
+    if job_id:
+        query = query.where(Evaluation.job_id == job_id)
+    if verdict:
+        query = query.where(Evaluation.verdict == verdict)
+    
+    def rows():
+        with Session(engine) as session:
+            for ev, candidate_name, job_title in session.exec(query.offset(skip).limit(limit)):
+                yield ndjson_line({
+                    "id": ev.id,
+                    "final_score": ev.final_score,
+                    "verdict": ev.verdict,
+                    "candidate_name": candidate_name or "Unknown",
+                    "job_title": job_title or "Unknown",
+                    "eval_time": ev.eval_time,
+                    "missing_skills": ev.missing_skills
+                })
+    
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
+
 @app.post("/api/bulk-evaluate")
-def bulk_evaluate(job_id: int = Form(...)):
-    """Evaluate all resumes against a specific job"""
+def bulk_evaluate(job_id: int = Form(...), resume_ids: str = Form("")):
+    """Evaluate all resumes (or the comma separated `resume_ids`) against a specific job"""
+    try:
+        selected_ids = [int(i) for i in resume_ids.split(",") if i.strip()]
+    except ValueError:
+        raise HTTPException(status_code=422, detail="resume_ids must be comma separated integers")
+    
     with Session(engine) as session:
         job = session.get(Job, job_id)
         if not job:
@@ -328,29 +485,34 @@ def bulk_evaluate(job_id: int = Form(...)):
             select(Evaluation.resume_id).where(Evaluation.job_id == job_id)
         ).all()
         
-        resumes = session.exec(
-            select(Resume).where(~Resume.id.in_(evaluated_resume_ids) if evaluated_resume_ids else True)
-        ).all()
+        query = select(Resume.id).where(~Resume.id.in_(evaluated_resume_ids) if evaluated_resume_ids else True)
+        if resume_ids:
+            query = query.where(Resume.id.in_(selected_ids))
+        pending_ids = session.exec(query.limit(50)).all()  # Limit to 50 resumes per batch
         
-        results = []
-        for resume in resumes[:50]:  # Limit to 50 resumes per batch
-            try:
-                # Evaluate each resume
-                eval_result = evaluate(resume_id=resume.id, job_id=job_id)
-                results.append({
-                    "resume_id": resume.id,
-                    "evaluation_id": eval_result["evaluation_id"],
-                    "score": eval_result["final_score"],
-                    "verdict": eval_result["verdict"]
-                })
-            except Exception as e:
-                results.append({
-                    "resume_id": resume.id,
-                    "error": str(e)
-                })
+        # Each evaluation opens its own session, so they can run side by side
+        if IN_MEMORY_DB:
+            results = [evaluate_for_bulk(resume_id, job_id) for resume_id in pending_ids]
+        else:
+            with ThreadPoolExecutor(max_workers=BULK_EVAL_WORKERS) as executor:
+                results = list(executor.map(lambda resume_id: evaluate_for_bulk(resume_id, job_id), pending_ids))
+        
+        # Best rows of this batch, so the UI can render them without a follow-up GET
+        top_results = []
+        scored = sorted((r for r in results if "score" in r), key=lambda r: r["score"], reverse=True)
+        for row in scored[:10]:
+            resume = session.get(Resume, row["resume_id"])
+            candidate = session.get(Candidate, resume.candidate_id) if resume and resume.candidate_id else None
+            top_results.append({
+                "evaluation_id": row["evaluation_id"],
+                "candidate_name": candidate.name if candidate else "Unknown",
+                "final_score": row["score"],
+                "verdict": row["verdict"]
+            })
         
         return {
             "job_id": job_id,
             "processed_count": len(results),
-            "results": results
+            "results": results,
+            "top_results": top_results
         }
@@ -1,7 +1,7 @@
 import pdfplumber
 from docx import Document
 import re
-from typing import Dict, List, Optional
+from typing import IO, Dict, List, Optional, Set, Union
 import json
 from datetime import datetime
 import os
@@ -13,7 +13,7 @@ try:
 except ImportError:
     genai = None
 
-def extract_text_pdf(path: str) -> str:
+def extract_text_pdf(path: Union[str, IO[bytes]]) -> str:
     text_parts = []
     with pdfplumber.open(path) as pdf:
         for page in pdf.pages:
@@ -22,7 +22,7 @@ def extract_text_pdf(path: str) -> str:
                 text_parts.append(t)
     return "\n".join(text_parts)
 
-def extract_text_docx(path: str) -> str:
+def extract_text_docx(path: Union[str, IO[bytes]]) -> str:
     try:
         doc = Document(path)
         return "\n".join([p.text for p in doc.paragraphs if p.text.strip()])
@@ -34,21 +34,32 @@ def normalize_text(text: str) -> str:
     text = re.sub(r"Page \d+ of \d+", "", text, flags=re.I)
     return text.strip()
 
+# Common technical skills to look for
+TECH_SKILLS = (
+    'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'mongodb', 'postgresql',
+    'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'machine learning', 'data science',
+    'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'flask', 'django',
+    'fastapi', 'html', 'css', 'git', 'linux', 'windows', 'excel', 'tableau', 'powerbi',
+    'spring boot', 'microservices', 'restful api', 'graphql', 'redis', 'elasticsearch'
+)
+# The lookahead yields the longest skill starting at each position; expanding it to
+# the skills it contains ('java' in 'javascript') keeps plain substring semantics
+TECH_SKILLS_RE = re.compile('(?=(' + '|'.join(map(re.escape, sorted(TECH_SKILLS, key=len, reverse=True))) + '))')
+TECH_SKILLS_CONTAINED = {skill: [other for other in TECH_SKILLS if other in skill] for skill in TECH_SKILLS}
+
+def find_tech_skills(text_lower: str) -> Set[str]:
+    """All TECH_SKILLS occurring in already-lowercased text, in one scan"""
+    found = set()
+    for match in TECH_SKILLS_RE.finditer(text_lower):
+        found.update(TECH_SKILLS_CONTAINED[match.group(1)])
+    return found
+
 def parse_skills(text: str) -> List[str]:
     """Enhanced skill extraction from resume text"""
     skills = set()
     text_lower = text.lower()
     lines = text_lower.splitlines()
     
-    # Common technical skills to look for
-    tech_skills = [
-        'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'mongodb', 'postgresql',
-        'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'machine learning', 'data science',
-        'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'flask', 'django',
-        'fastapi', 'html', 'css', 'git', 'linux', 'windows', 'excel', 'tableau', 'powerbi',
-        'spring boot', 'microservices', 'restful api', 'graphql', 'redis', 'elasticsearch'
-    ]
-    
     # Look for skills in dedicated sections
     for i, line in enumerate(lines):
         if any(keyword in line for keyword in ['skills', 'technologies', 'tools', 'programming']):
@@ -61,9 +72,7 @@ def parse_skills(text: str) -> List[str]:
                         skills.add(clean_part)
     
     # Look for common technical skills throughout the text
-    for skill in tech_skills:
-        if skill in text_lower:
-            skills.add(skill)
+    skills.update(find_tech_skills(text_lower))
     
     return list(skills)
 
@@ -231,15 +240,6 @@ def parse_job_description_fallback(jd_text: str) -> Dict:
             title = line.strip()
             break
     
-    # Common technical skills to look for
-    tech_skills = [
-        'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'mongodb', 'postgresql',
-        'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'machine learning', 'data science',
-        'tensorflow', 'pytorch', 'pandas', 'numpy', 'scikit-learn', 'flask', 'django',
-        'fastapi', 'html', 'css', 'git', 'linux', 'windows', 'excel', 'tableau', 'powerbi',
-        'spring boot', 'microservices', 'restful api', 'graphql', 'redis', 'elasticsearch'
-    ]
-    
     must_have = []
     nice_to_have = []
     
@@ -258,8 +258,9 @@ def parse_job_description_fallback(jd_text: str) -> Dict:
             current_section = 'must_have'
         
         # Extract skills from line
-        for skill in tech_skills:
-            if skill in line_lower:
+        line_skills = find_tech_skills(line_lower)
+        for skill in TECH_SKILLS:
+            if skill in line_skills:
                 if current_section == 'must_have' and skill not in must_have:
                     must_have.append(skill)
                 elif current_section == 'nice_to_have' and skill not in nice_to_have:
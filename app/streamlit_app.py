@@ -1,10 +1,35 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import pyarrow as pa
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson decodes API responses much faster than the stdlib json module
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# requests_toolbelt streams multipart uploads; without it requests builds the body in memory
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+PAGES = ("Dashboard Overview", "Job Management", "Resume Upload", "Bulk Evaluation", "Analytics")
+VERDICT_COLORS = {
+    'High': 'background-color: #d4edda',
+    'Medium': 'background-color: #fff3cd',
+    'Low': 'background-color: #f8d7da'
+}
 
 # Configure page
 st.set_page_config(
@@ -35,82 +60,137 @@ st.title("💼 Resume Relevance Check System")
 st.markdown("### AI-Powered Resume Evaluation Platform for Innomatics Research Labs")
 
 # Sidebar navigation
-page = st.sidebar.selectbox(
-    "Navigate to:",
-    ["Dashboard Overview", "Job Management", "Resume Upload", "Bulk Evaluation", "Analytics"]
-)
+page = st.sidebar.selectbox("Navigate to:", PAGES)
 
-def get_api_data(endpoint, params=None):
-    """Helper function to fetch data from API"""
+@st.cache_resource
+def api_session():
+    """Keep-alive HTTP session shared across reruns so calls reuse open connections"""
+    session = requests.Session()
+    # Retry only covers idempotent methods by default, so POSTs are never replayed
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Open the first keep-alive connection now so the first page load does not pay the handshake
     try:
-        response = requests.get(f"{API}{endpoint}", params=params or {})
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"API Error: {response.status_code}")
-            return None
+        session.get(f"{API}/health", timeout=1)
+    except requests.RequestException:
+        pass
+    return session
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_get(api, endpoint, params_json):
+    """GET response JSON, memoized across reruns; failures raise so they are not cached"""
+    with api_session().get(f"{api}{endpoint}", params=json.loads(params_json), stream=True) as response:
+        response.raise_for_status()
+        if response.headers.get('content-type', '').startswith('application/x-ndjson'):
+            # NDJSON rows are decoded as their lines arrive instead of as one array at the end
+            return [json_loads(line) for line in response.iter_lines() if line]
+        return json_loads(response.content)
+
+def fetch_api_data(endpoint, params=None):
+    """Fetch data from API, returning (data, error) without touching the page"""
+    try:
+        return cached_get(API, endpoint, json.dumps(params or {}, sort_keys=True)), None
+    except requests.HTTPError as e:
+        return None, f"API Error: {e.response.status_code}"
     except Exception as e:
-        st.error(f"Connection Error: {str(e)}")
-        return None
+        return None, f"Connection Error: {str(e)}"
+
+def get_api_data(endpoint, params=None):
+    """Helper function to fetch data from API"""
+    data, error = fetch_api_data(endpoint, params)
+    if error:
+        st.error(error)
+    return data
+
+def get_api_data_many(*calls):
+    """Fetch several (endpoint, params) pairs concurrently so a page waits for the slowest, not the sum"""
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        results = list(executor.map(lambda call: fetch_api_data(*call), calls))
+    # Streamlit elements can only be written from the script thread
+    for _, error in results:
+        if error:
+            st.error(error)
+    return [data for data, _ in results]
 
 def post_api_data(endpoint, data=None, files=None):
     """Helper function to post data to API"""
     try:
-        if files:
-            response = requests.post(f"{API}{endpoint}", data=data, files=files)
+        if files and MultipartEncoder:
+            # Stream the file from its buffer instead of copying it into a multipart body first
+            fields = dict(data or {})
+            fields.update({
+                key: (upload.name, upload, getattr(upload, 'type', None) or 'application/octet-stream')
+                for key, upload in files.items()
+            })
+            body = MultipartEncoder(fields)
+            response = api_session().post(f"{API}{endpoint}", data=body, headers={"Content-Type": body.content_type})
+        elif files:
+            response = api_session().post(f"{API}{endpoint}", data=data, files=files)
         else:
-            response = requests.post(f"{API}{endpoint}", data=data)
-        return response.json()
+            response = api_session().post(f"{API}{endpoint}", data=data)
+        # Any successful write can change what the cached GETs would return
+        if response.ok:
+            cached_get.clear()
+        return json_loads(response.content)
     except Exception as e:
         st.error(f"Submission Error: {str(e)}")
         return None
 
+def evaluations_key(evaluations):
+    """Hashable snapshot of the evaluation fields Analytics reads, for cache keys"""
+    return tuple((e['id'], e['eval_time'], e['final_score'], e['verdict'], e['job_title']) for e in evaluations)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def build_analytics(evaluation_rows, _evaluations):
+    """Analytics frame with parsed timestamps and its aggregates, rebuilt only when the data changes"""
+    df = pd.DataFrame(_evaluations)
+    df['eval_time'] = pd.to_datetime(df['eval_time'], format="ISO8601", cache=True, utc=True)
+    return {
+        'df': df.sort_values('eval_time', ascending=False),
+        'daily_evals': df.groupby(df['eval_time'].dt.date).size()
+    }
+
 if page == "Dashboard Overview":
     st.header("📈 Dashboard Overview")
     
-    # Fetch overview data
-    jobs = get_api_data("/api/jobs", {"limit": 100})
-    resumes = get_api_data("/api/resumes", {"limit": 100})
-    evaluations = get_api_data("/api/evaluations", {"limit": 100})
+    # Counts, score histogram and recent rows all come from one summary call
+    summary = get_api_data("/api/dashboard-summary")
     
-    if jobs and resumes and evaluations:
+    if summary and summary['jobs'] and summary['resumes'] and summary['evaluations']:
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Jobs", len(jobs))
+            st.metric("Total Jobs", summary['jobs'])
         with col2:
-            st.metric("Total Resumes", len(resumes))
+            st.metric("Total Resumes", summary['resumes'])
         with col3:
-            st.metric("Total Evaluations", len(evaluations))
+            st.metric("Total Evaluations", summary['evaluations'])
         with col4:
-            if evaluations:
-                avg_score = sum(ev['final_score'] for ev in evaluations) / len(evaluations)
-                st.metric("Average Score", f"{avg_score:.1f}%")
+            if summary['average_score'] is not None:
+                st.metric("Average Score", f"{summary['average_score']:.1f}%")
         
         # Recent evaluations
         st.subheader("🔄 Recent Evaluations")
-        if evaluations:
-            df = pd.DataFrame(evaluations)
-            df['eval_time'] = pd.to_datetime(df['eval_time'])
-            df = df.sort_values('eval_time', ascending=False).head(10)
+        if summary['recent']:
+            # Already newest first from the server
+            df = pd.DataFrame(summary['recent'])
+            df['eval_time'] = pd.to_datetime(df['eval_time'], format="ISO8601", cache=True, utc=True)
             
             # Color code by verdict
-            def color_verdict(verdict):
-                colors = {'High': 'background-color: #d4edda', 'Medium': 'background-color: #fff3cd', 'Low': 'background-color: #f8d7da'}
-                return colors.get(verdict, '')
-            
             styled_df = df[['candidate_name', 'job_title', 'final_score', 'verdict', 'eval_time']].style.map(
-                lambda x: color_verdict(x) if x in ['High', 'Medium', 'Low'] else '', subset=['verdict']
+                lambda verdict: VERDICT_COLORS.get(verdict, ''), subset=['verdict']
             )
             st.dataframe(styled_df, use_container_width=True)
         
         # Score distribution chart
-        if evaluations:
-            st.subheader("📉 Score Distribution")
-            scores = [ev['final_score'] for ev in evaluations]
-            fig = px.histogram(x=scores, nbins=20, title="Distribution of Resume Scores")
-            fig.update_layout(xaxis_title="Score", yaxis_title="Count")
-            st.plotly_chart(fig, use_container_width=True)
+        st.subheader("📉 Score Distribution")
+        # Bin counts are aggregated in SQL over every evaluation; Plotly only draws the bars
+        width = summary['score_bin_width']
+        counts = summary['score_bins']
+        fig = go.Figure(go.Bar(x=np.arange(len(counts)) * width + width / 2, y=counts, width=width))
+        fig.update_layout(title="Distribution of Resume Scores", xaxis_title="Score", yaxis_title="Count")
+        st.plotly_chart(fig, use_container_width=True)
 
 elif page == "Job Management":
     st.header("💼 Job Management")
@@ -237,34 +317,40 @@ elif page == "Resume Upload":
     
     with col2:
         st.subheader("📊 Upload Statistics")
-        resumes = get_api_data("/api/resumes", {"limit": 100})
-        if resumes:
-            st.metric("Total Resumes", len(resumes))
+        # The total comes from a SQL count; only the five listed rows are fetched
+        summary, resumes = get_api_data_many(
+            ("/api/dashboard-summary", None),
+            ("/api/resumes", {"limit": 5, "fields": "candidate_name,candidate_email"})
+        )
+        if summary and resumes:
+            st.metric("Total Resumes", summary['resumes'])
             
             # Recent uploads
             st.write("**Recent Uploads:**")
-            for resume in resumes[:5]:
+            for resume in resumes:
                 st.write(f"• {resume.get('candidate_name', 'Unknown')} - {resume.get('candidate_email', 'No email')}")
 
 elif page == "Bulk Evaluation":
     st.header("🔍 Bulk Resume Evaluation")
     
-    # Job selection for bulk evaluation
-    jobs = get_api_data("/api/jobs", {"limit": 100})
-    resumes = get_api_data("/api/resumes", {"limit": 100})
+    # Job selection for bulk evaluation; resume/evaluation counts come from the summary
+    jobs, summary = get_api_data_many(
+        ("/api/jobs", {"limit": 100}),
+        ("/api/dashboard-summary", None)
+    )
     
-    if jobs and resumes:
+    if jobs and summary and summary['resumes']:
         col1, col2 = st.columns([2, 1])
         
         with col1:
             st.subheader("🎯 Select Job for Bulk Evaluation")
             
-            job_options = {f"{job['title']} (ID: {job['id']})": job['id'] for job in jobs}
-            selected_job_name = st.selectbox("Choose Job:", list(job_options.keys()))
+            jobs_by_id = {job['id']: job for job in jobs}
+            job_id = st.selectbox("Choose Job:", list(jobs_by_id),
+                                  format_func=lambda i: f"{jobs_by_id[i]['title']} (ID: {i})")
             
-            if selected_job_name:
-                job_id = job_options[selected_job_name]
-                selected_job = next(job for job in jobs if job['id'] == job_id)
+            if job_id is not None:
+                selected_job = jobs_by_id[job_id]
                 
                 st.write(f"**Must-Have Skills:** {', '.join(selected_job.get('must_have', []))}")
                 st.write(f"**Nice-to-Have Skills:** {', '.join(selected_job.get('nice_to_have', []))}")
@@ -277,52 +363,56 @@ elif page == "Bulk Evaluation":
                             st.success(f"✅ Bulk evaluation completed!")
                             st.info(f"📊 Processed {result['processed_count']} resumes")
                             
-                            # Show some sample results
-                            evaluations = get_api_data("/api/evaluations", {"job_id": job_id, "limit": 10})
-                            if evaluations:
+                            # Top results come back with the bulk response itself
+                            top_results = result.get('top_results')
+                            if top_results:
                                 st.subheader("📈 Sample Results")
-                                df = pd.DataFrame(evaluations)
-                                st.dataframe(df[['candidate_name', 'final_score', 'verdict']], use_container_width=True)
+                                # Arrow table straight from the rows; st.dataframe renders it without a pandas hop
+                                table = pa.Table.from_pylist(top_results).select(['candidate_name', 'final_score', 'verdict'])
+                                st.dataframe(table, use_container_width=True)
         
         with col2:
             st.subheader("📊 Statistics")
             st.metric("Available Jobs", len(jobs))
-            st.metric("Available Resumes", len(resumes))
+            st.metric("Available Resumes", summary['resumes'])
             
-            evaluations = get_api_data("/api/evaluations", {"limit": 100})
-            if evaluations:
-                st.metric("Total Evaluations", len(evaluations))
+            if summary['evaluations']:
+                st.metric("Total Evaluations", summary['evaluations'])
 
 elif page == "Analytics":
     st.header("📊 Analytics & Insights")
     
-    evaluations = get_api_data("/api/evaluations", {"limit": 200})
-    jobs = get_api_data("/api/jobs", {"limit": 100})
+    # Verdict and per-job aggregates are computed by the database over all evaluations
+    evaluations, jobs, verdict_counts, job_scores = get_api_data_many(
+        ("/api/evaluations/stream", {"limit": 200}),
+        ("/api/jobs", {"limit": 100}),
+        ("/api/analytics/verdict-counts", None),
+        ("/api/analytics/job-score-means", None)
+    )
     
     if evaluations and jobs:
         # Convert to DataFrame
-        df = pd.DataFrame(evaluations)
+        analytics = build_analytics(evaluations_key(evaluations), evaluations)
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("🎯 Score Distribution by Verdict")
-            verdict_counts = df['verdict'].value_counts()
-            fig = px.pie(values=verdict_counts.values, names=verdict_counts.index, 
-                        title="Evaluation Verdicts Distribution")
+            verdict_counts = verdict_counts or {}
+            fig = go.Figure(go.Pie(values=list(verdict_counts.values()), labels=list(verdict_counts.keys())))
+            fig.update_layout(title="Evaluation Verdicts Distribution")
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             st.subheader("📈 Average Scores by Job")
-            job_scores = df.groupby('job_title')['final_score'].mean().sort_values(ascending=False)
-            fig = px.bar(x=job_scores.values, y=job_scores.index, 
+            job_scores = job_scores or []
+            fig = px.bar(x=[row['avg_score'] for row in job_scores], y=[row['job_title'] for row in job_scores], 
                         title="Average Resume Scores by Job Position", orientation='h')
             st.plotly_chart(fig, use_container_width=True)
         
         # Timeline analysis
         st.subheader("📅 Evaluation Timeline")
-        df['eval_time'] = pd.to_datetime(df['eval_time'])
-        daily_evals = df.groupby(df['eval_time'].dt.date).size()
+        daily_evals = analytics['daily_evals']
         
         fig = px.line(x=daily_evals.index, y=daily_evals.values, 
                      title="Daily Evaluation Volume")
@@ -331,7 +421,7 @@ elif page == "Analytics":
         
         # Detailed table
         st.subheader("📋 Detailed Evaluation Results")
-        st.dataframe(df.sort_values('eval_time', ascending=False), use_container_width=True)
+        st.dataframe(analytics['df'], use_container_width=True)
     
     else:
         st.info("No evaluation data available yet. Start by creating jobs and uploading resumes!")
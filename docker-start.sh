@@ -4,11 +4,25 @@
 
 echo "🚀 Starting Resume Relevance Check System in Docker..."
 
-# Start FastAPI backend in background
-uvicorn app.main:app --host 0.0.0.0 --port 8003 &
+backend_up() {
+    python -c "import urllib.request; urllib.request.urlopen('http://127.0.0.1:8003/health', timeout=0.2)" 2>/dev/null
+}
 
-# Wait for backend to start
-sleep 5
+# Start FastAPI backend in background, unless one is already serving the port
+if backend_up; then
+    echo "FastAPI already running on port 8003"
+else
+    # Separate worker processes keep CPU-bound parsing/scoring off each other's GIL
+    uvicorn app.main:app --host 0.0.0.0 --port 8003 --loop uvloop --http httptools --no-access-log \
+        --backlog 256 --limit-concurrency 100 --workers "${UVICORN_WORKERS:-2}" &
+
+    # Wait for the backend to answer /health, backing off instead of sleeping a fixed 5 seconds
+    for delay in 0.05 0.1 0.2 0.4 0.8 1.6 3.2; do
+        sleep "$delay"
+        backend_up && break
+    done
+    backend_up || echo "⚠️ FastAPI backend did not answer /health; starting Streamlit anyway" >&2
+fi
 
 # Start Streamlit dashboard
 streamlit run app/streamlit_app.py --server.port 8505 --server.address 0.0.0.0
\ No newline at end of file
@@ -1,18 +1,53 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
+import hashlib
+import io
+import functools
 import re
 from datetime import datetime
-import tempfile
+from collections import Counter
+import heapq
 import os
+import sqlite3
+import threading
+import secrets
+import importlib
+import importlib.util
 
-# Import PDF and document parsing functions
+# orjson (de)serializes stored records much faster than the stdlib json module
 try:
-    from app.parsers import extract_text_pdf, extract_text_docx, normalize_text, parse_resume_structured
-    PDF_SUPPORT = True
+    import orjson
+    json_loads = orjson.loads
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+# PDF and document parsing functions. app.parsers pulls in pdfplumber,
+# python-docx and the Gemini SDK, so it is only imported when a file is parsed.
+try:
+    PDF_SUPPORT = all(importlib.util.find_spec(name) for name in ('pdfplumber', 'docx', 'app.parsers'))
 except ImportError:
-    # Fallback functions if parsers module is not available
     PDF_SUPPORT = False
+
+def parser(name):
+    """Function from app.parsers, imported on first use"""
+    return getattr(importlib.import_module('app.parsers'), name)
+
+if PDF_SUPPORT:
+    def extract_text_pdf(path):
+        return parser('extract_text_pdf')(path)
+    def extract_text_docx(path):
+        return parser('extract_text_docx')(path)
+    def normalize_text(text):
+        return parser('normalize_text')(text)
+    def parse_resume_structured(text):
+        return parser('parse_resume_structured')(text)
+else:
+    # Fallback functions if parsers module is not available
     def extract_text_pdf(path):
         return "PDF parsing not available - please install required dependencies"
     def extract_text_docx(path):
@@ -22,6 +57,56 @@ except ImportError:
     def parse_resume_structured(text):
         return {'skills': [], 'education': [], 'experience': []}
 
+STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resumes.db")
+STORE_TABLES = ('jobs', 'resumes', 'evaluations')
+# Lookup fields rebuilt from the skill lists on load rather than stored
+DERIVED_FIELDS = {'required_set', 'preferred_set', 'skills_set'}
+# Keywords that indicate each resume section, found in one pass over the text
+SECTION_WORDS = {
+    'Experience/Work History': frozenset(['experience', 'work', 'employment', 'position']),
+    'Education': frozenset(['education', 'degree', 'university', 'college']),
+    'Skills': frozenset(['skills', 'technical', 'proficient']),
+    'Projects': frozenset(['project', 'portfolio', 'github']),
+    'Certifications': frozenset(['certification', 'certified', 'license'])
+}
+SECTION_KEYWORDS_RE = re.compile('|'.join(
+    map(re.escape, sorted(frozenset().union(*SECTION_WORDS.values()), key=len, reverse=True))
+))
+# Default skill list (lowercase) - can be expanded
+DEFAULT_SKILLS = (
+    'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node.js',
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'docker', 'kubernetes',
+    'aws', 'azure', 'gcp', 'machine learning', 'data science', 'tensorflow',
+    'pytorch', 'pandas', 'numpy', 'scikit-learn', 'flask', 'django', 'fastapi',
+    'html', 'css', 'git', 'linux', 'excel', 'powerbi', 'tableau', 'spark',
+    'hadoop', 'kafka', 'rest api', 'graphql', 'microservices', 'devops',
+    'ci/cd', 'jenkins', 'terraform', 'ansible', 'spring', 'boot'
+)
+# Bump when the default skill list changes so cached extractions are dropped
+SKILL_LEXICON_VERSION = 2
+HISTORY_PAGE_SIZE = 100
+CSV_CHUNK_ROWS = 1000
+AUTO_SCORING_COLUMNS = ['Job', 'Rank', 'Candidate', 'Score', 'Verdict', 'Matched Skills', 'Missing Skills']
+PAGES = ("Dashboard", "Job Management", "Resume Upload", "Bulk Operations", "Evaluation", "Analytics", "AI Assistant")
+ANALYTICS_COLUMNS = ['id', 'score', 'verdict', 'job_title', 'candidate_name', 'evaluation_date']
+EXPORT_COLUMNS = ('id', 'job_id', 'resume_id', 'job_title', 'candidate_name', 'score', 'verdict',
+                  'matched_skills', 'missing_skills', 'feedback', 'evaluation_date')
+EVALUATION_CATEGORY_COLUMNS = ['verdict', 'job_title', 'candidate_name']
+SCORE_BUCKET_EDGES = np.array([40, 60, 80], dtype=np.int8)
+SCORE_BUCKET_LABELS = ['0-40%', '41-60%', '61-80%', '81-100%']
+VERDICT_COLORS = {
+    'High': 'background-color: #d4edda',
+    'Medium': 'background-color: #fff3cd',
+    'Low': 'background-color: #f8d7da'
+}
+# Verdict for every possible score, so get_verdict is a single lookup
+_VERDICT_LUT = tuple("Low" if s < 60 else "Medium" if s < 80 else "High" for s in range(101))
+# Header and job-title words that rule a line out as the candidate's name
+NAME_SKIP_WORDS = ('resume', 'cv', 'curriculum vitae', 'profile', 'summary', 'objective')
+JOB_TITLE_WORDS = ('engineer', 'developer', 'manager', 'analyst', 'coordinator', 'specialist')
+# Lines made only of dashes separate resumes in the bulk text box
+_BULK_SEP_RE = re.compile(r'^\s*-{3,}\s*$', re.MULTILINE)
+
 # Configure Streamlit page
 st.set_page_config(
     page_title="Resume Relevance System",
@@ -29,28 +114,18 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize session state
-if 'jobs' not in st.session_state:
-    st.session_state.jobs = []
-if 'resumes' not in st.session_state:
-    st.session_state.resumes = []
-if 'evaluations' not in st.session_state:
-    st.session_state.evaluations = []
-
 st.title("Resume Relevance Check System")
 st.markdown("**AI-Powered Resume Evaluation Platform for Innomatics Research Labs**")
 
 # Sidebar navigation
 st.sidebar.title("Navigation")
-page = st.sidebar.selectbox(
-    "Select Page:",
-    ["Dashboard", "Job Management", "Resume Upload", "Bulk Operations", "Evaluation", "Analytics", "AI Assistant"]
-)
+page = st.sidebar.selectbox("Select Page:", PAGES)
 
 # Helper functions
 def extract_candidate_details(text):
     """Extract candidate name and email from resume text using improved patterns"""
-    lines = text.strip().split('\n')
+    # Only the first few lines can hold the name
+    lines = text.strip().split('\n', 10)[:10]
     name = None
     email = None
     phone = None
@@ -63,22 +138,21 @@ def extract_candidate_details(text):
     
     # Improved name extraction
     # Look for name in first few lines, avoiding headers like "Resume" or "CV"
-    for line in lines[:10]:
+    for line in lines:
         line = line.strip()
         if not line:
             continue
+        line_lower = line.lower()
             
         # Skip common header words
-        skip_words = ['resume', 'cv', 'curriculum vitae', 'profile', 'summary', 'objective']
-        if any(word in line.lower() for word in skip_words):
+        if any(word in line_lower for word in NAME_SKIP_WORDS):
             continue
             
         # Check if line looks like a name (2-4 words, mostly alphabetic)
         words = line.split()
         if 2 <= len(words) <= 4 and all(word.replace('.', '').isalpha() for word in words):
             # Additional check: avoid lines with job titles or locations
-            job_indicators = ['engineer', 'developer', 'manager', 'analyst', 'coordinator', 'specialist']
-            if not any(indicator in line.lower() for indicator in job_indicators):
+            if not any(indicator in line_lower for indicator in JOB_TITLE_WORDS):
                 name = line
                 break
     
@@ -94,75 +168,582 @@ def extract_candidate_details(text):
         'phone': phone
     }
 
-def extract_skills(text, custom_skills=None):
-    """Extract skills from text using keyword matching"""
-    # Default skill list - can be expanded
-    default_skills = [
-        'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node.js',
-        'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'docker', 'kubernetes',
-        'aws', 'azure', 'gcp', 'machine learning', 'data science', 'tensorflow',
-        'pytorch', 'pandas', 'numpy', 'scikit-learn', 'flask', 'django', 'fastapi',
-        'html', 'css', 'git', 'linux', 'excel', 'powerbi', 'tableau', 'spark',
-        'hadoop', 'kafka', 'rest api', 'graphql', 'microservices', 'devops',
-        'ci/cd', 'jenkins', 'terraform', 'ansible', 'spring', 'boot'
-    ]
-    
-    skills_to_check = custom_skills if custom_skills else default_skills
-    found_skills = []
-    text_lower = text.lower()
+def skill_trie_pattern(skills):
+    """Regex alternation factored by shared prefixes, trying longer skills first"""
+    trie = {}
+    for skill in skills:
+        node = trie
+        for char in skill:
+            node = node.setdefault(char, {})
+        node[''] = {}
     
-    for skill in skills_to_check:
-        if skill.lower() in text_lower:
-            found_skills.append(skill)
+    def render(node):
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if '' in node:
+            # A skill ends here; only fall back to it when no longer skill matches
+            branches.append('')
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
     
-    return found_skills
+    return render(trie)
+
+@st.cache_resource
+def skill_scanner(skills):
+    """One-pass scanner for a skill lexicon, matching whole words only.
+
+    The skills are compiled as a prefix trie so each position branches on its
+    next character instead of trying every skill in turn, and positions whose
+    character starts no skill are rejected before the trie is entered. The
+    lookahead reports the longest skill starting at every position, and
+    each skill maps to the lexicon skills it contains as whole words, so
+    overlapping matches such as 'spring' inside 'spring boot' are still found
+    while 'java' no longer matches inside 'javascript'.
+    """
+    ordered = sorted(set(skills) - {''}, key=len, reverse=True)
+    if not ordered:
+        # Nothing to find; an empty character class would not compile
+        return re.compile(r'(?!)'), {}
+    initials = re.escape(''.join(sorted({skill[0] for skill in ordered})))
+    scanner = re.compile(r'(?<!\w)(?=[' + initials + r'])(?=(' + skill_trie_pattern(ordered) + r')(?!\w))')
+    contained = {
+        skill: [other for other in ordered if re.search(r'(?<!\w)' + re.escape(other) + r'(?!\w)', skill)]
+        for skill in ordered
+    }
+    return scanner, contained
+
+@st.cache_resource
+def default_skill_scanner():
+    """Scanner for DEFAULT_SKILLS, built once per server process"""
+    return skill_scanner(DEFAULT_SKILLS)
+
+def scan_skills(text, skills, scanner, contained):
+    """Lexicon skills found in the text, in lexicon order"""
+    found = set()
+    for match in scanner.finditer(text.lower()):
+        found.update(contained[match.group(1)])
+    return [skill for skill in skills if skill in found]
+
+def extract_skills(text, custom_skills=None):
+    """Extract skills from text using whole-word keyword matching"""
+    if custom_skills:
+        skills = tuple(skill.lower() for skill in custom_skills)
+        return scan_skills(text, skills, *skill_scanner(skills))
+    return scan_skills(text, DEFAULT_SKILLS, *default_skill_scanner())
+
+def content_hash(text):
+    """Stable key for resume text so extraction is cached by content"""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+@st.cache_data(show_spinner=False)
+def resume_skills(text_hash, _text, custom_skills=None, version=SKILL_LEXICON_VERSION):
+    """Skills of a resume, cached by content hash instead of hashing the text itself"""
+    return extract_skills(_text, list(custom_skills) if custom_skills else None)
+
+def make_preview(content, limit=300):
+    """Truncated resume text shown in the Manage Resumes tab"""
+    return content[:limit] + "..." if len(content) > limit else content
+
+def parse_upload(uploaded_file, file_extension):
+    """Normalized text of an uploaded PDF or DOCX, parsed from its buffer without a temp file; None on failure"""
+    extract = extract_text_pdf if file_extension == 'pdf' else extract_text_docx
+    try:
+        return normalize_text(extract(io.BytesIO(uploaded_file.getvalue())))
+    except Exception as e:
+        st.error(f"Error processing {file_extension.upper()}: {str(e)}")
+        return None
+
+def normalize_skills(skills):
+    """Lowercase and strip skills once so scoring can compare them directly"""
+    return [skill.lower().strip() for skill in skills]
+
+def description_skills(job):
+    """Required skills that were picked up from the job description rather than typed in"""
+    typed = set(normalize_skills(job['required_skills']))
+    return [skill for skill in job['required_skills_norm'] if skill not in typed]
 
 def calculate_score(required_skills, candidate_skills):
-    """Calculate match score between required and candidate skills"""
+    """Calculate match score between pre-normalized required and candidate skills"""
     if not required_skills:
         return 85
     
-    required_set = set(skill.lower().strip() for skill in required_skills)
-    candidate_set = set(skill.lower().strip() for skill in candidate_skills)
+    required_set = set(required_skills)
+    return match_score(len(required_set.intersection(candidate_skills)), len(required_set))
+
+def match_score(matches, total_required):
+    """Score from an already computed match count"""
+    score = matches * 100 // total_required if total_required > 0 else 85
+    return min(max(score, 0), 100)
+
+def score_matrix(jobs, resumes):
+    """Scores for every (job, resume) pair at once, as a jobs x resumes array"""
+    vocab = {}
+    job_rows = [[vocab.setdefault(skill, len(vocab)) for skill in job['required_set']] for job in jobs]
+    resume_rows = [[vocab.setdefault(skill, len(vocab)) for skill in resume['skills_set']] for resume in resumes]
     
-    matches = len(required_set & candidate_set)
-    total_required = len(required_set)
+    # Skill-incidence matrices: one row per job/resume, one column per known skill
+    job_mat = np.zeros((len(jobs), len(vocab)), dtype=np.int32)
+    resume_mat = np.zeros((len(resumes), len(vocab)), dtype=np.int32)
+    for i, cols in enumerate(job_rows):
+        job_mat[i, cols] = 1
+    for i, cols in enumerate(resume_rows):
+        resume_mat[i, cols] = 1
     
-    score = int((matches / total_required) * 100) if total_required > 0 else 85
-    return min(max(score, 0), 100)
+    matches = job_mat @ resume_mat.T
+    totals = job_mat.sum(axis=1)[:, None]
+    scores = np.where(totals > 0, matches * 100 // np.maximum(totals, 1), 85)
+    return np.clip(scores, 0, 100)
 
 def get_verdict(score):
-    """Get verdict based on score"""
-    if score >= 80:
-        return "High"
-    elif score >= 60:
-        return "Medium"
-    else:
-        return "Low"
+    """Get verdict based on score (scores are already clamped to 0-100)"""
+    return _VERDICT_LUT[score]
 
 def generate_feedback(score, verdict, matched_skills, missing_skills):
     """Generate detailed feedback"""
-    feedback = f"Overall Score: {score}% ({verdict} suitability)\n\n"
+    return _generate_feedback(score, verdict, tuple(sorted(matched_skills)), tuple(sorted(missing_skills)))
+
+@functools.lru_cache(maxsize=1024)
+def _generate_feedback(score, verdict, matched_skills, missing_skills):
+    """Feedback text, memoized because bulk runs repeat the same skill gaps"""
+    parts = [f"Overall Score: {score}% ({verdict} suitability)", ""]
     
     if matched_skills:
-        feedback += f"Strengths:\n"
-        for skill in matched_skills:
-            feedback += f"+ {skill}\n"
-        feedback += "\n"
+        parts.append("Strengths:")
+        parts.extend(f"+ {skill}" for skill in matched_skills)
+        parts.append("")
     
     if missing_skills:
-        feedback += f"Areas for Improvement:\n"
-        for skill in missing_skills:
-            feedback += f"- {skill}\n"
-        feedback += "\n"
+        parts.append("Areas for Improvement:")
+        parts.extend(f"- {skill}" for skill in missing_skills)
+        parts.append("")
     
     if score < 70:
-        feedback += "Recommendations:\n"
-        feedback += "- Focus on developing the missing skills\n"
-        feedback += "- Consider relevant certifications or training\n"
-        feedback += "- Build projects that demonstrate these skills\n"
+        parts.append("Recommendations:")
+        parts.append("- Focus on developing the missing skills")
+        parts.append("- Consider relevant certifications or training")
+        parts.append("- Build projects that demonstrate these skills")
+    
+    return "\n".join(parts) + "\n"
+
+def verdict_styles(verdicts):
+    """Background colors for a whole Verdict column in one lookup"""
+    return verdicts.astype(object).map(VERDICT_COLORS).fillna('')
+
+def job_skills_key(jobs):
+    """Hashable snapshot of each job's required skills for cache keys"""
+    return tuple((job['id'], tuple(job['required_skills_norm'])) for job in jobs)
+
+def resume_skills_key(resumes):
+    """Hashable snapshot of each resume's skills for cache keys"""
+    return tuple((resume['id'], tuple(resume['skills'])) for resume in resumes)
+
+def evaluations_key(evaluations):
+    """Hashable snapshot of the evaluation fields Analytics reads, for cache keys"""
+    return tuple(
+        (e['id'], e['score'], e['verdict'], e['job_title'], e['candidate_name'], e['evaluation_date'])
+        for e in evaluations
+    )
+
+def export_key(evaluations):
+    """Hashable snapshot of every exported evaluation field, so equal keys always mean equal reports"""
+    return tuple(
+        tuple(tuple(value) if isinstance(value, list) else value for value in map(e.get, EXPORT_COLUMNS))
+        for e in evaluations
+    )
+
+@st.cache_data(show_spinner=False)
+def compute_skill_demand(job_skills):
+    """Count how many jobs require each skill"""
+    return Counter(skill for _, skills in job_skills for skill in skills)
+
+@st.cache_data(show_spinner=False)
+def compute_skill_supply(resume_skills):
+    """Count how many resumes list each skill"""
+    return Counter(skill for _, skills in resume_skills for skill in skills)
+
+@st.cache_data(show_spinner=False)
+def check_resume_sections(content):
+    """Report which standard resume sections the text mentions"""
+    found = frozenset(SECTION_KEYWORDS_RE.findall(content.lower()))
+    return {section: not found.isdisjoint(words) for section, words in SECTION_WORDS.items()}
+
+def build_evaluations_df(evaluations):
+    """DataFrame of evaluations with compact dtypes (scores are 0-100)"""
+    df = pd.DataFrame(evaluations)
+    df['score'] = df['score'].astype('int8')
+    for column in EVALUATION_CATEGORY_COLUMNS:
+        df[column] = df[column].astype('category')
+    return df
+
+@st.cache_data(show_spinner=False)
+def compute_analytics(evaluation_rows):
+    """Summary figures, chart series and sorted history for the Analytics page"""
+    df = build_evaluations_df(pd.DataFrame.from_records(evaluation_rows, columns=ANALYTICS_COLUMNS))
+    scores = df['score'].to_numpy()
+    
+    # Bucket index = number of upper edges below the score, so each range includes its upper edge
+    buckets = np.searchsorted(SCORE_BUCKET_EDGES, scores, side='left')
+    score_counts = pd.Series(np.bincount(buckets, minlength=len(SCORE_BUCKET_LABELS)), index=SCORE_BUCKET_LABELS)
+    
+    # Job-wise analysis: integer job codes let bincount do the grouping
+    job_codes, job_titles = pd.factorize(df['job_title'], sort=True)
+    job_stats = None
+    if len(job_titles) > 1:
+        job_counts = np.bincount(job_codes)
+        job_totals = np.bincount(job_codes, weights=scores.astype(np.float64))
+        job_stats = pd.DataFrame(
+            {'Average Score': (job_totals / job_counts).round(1), 'Number of Evaluations': job_counts},
+            index=pd.Index(job_titles, name='job_title')
+        )
     
-    return feedback
+    history = df[['evaluation_date', 'candidate_name', 'job_title', 'score', 'verdict']].copy()
+    history.columns = ['Date', 'Candidate', 'Job', 'Score (%)', 'Verdict']
+    history = history.sort_values('Date', ascending=False)
+    
+    return {
+        'total': len(df),
+        'average': float(scores.mean()),
+        'high': int((df['verdict'] == 'High').sum()),
+        'low': int((df['verdict'] == 'Low').sum()),
+        'score_counts': score_counts,
+        'verdict_counts': df['verdict'].value_counts(),
+        'job_stats': job_stats,
+        'history': history
+    }
+
+def evaluations_frame():
+    """Session evaluations DataFrame, extended only with rows added since the last call"""
+    evaluations = st.session_state.evaluations
+    df = st.session_state.get('_evaluations_df')
+    # Stored evaluations are only ever appended, so the frame is reusable while its last id still lines up
+    if df is None or len(df) > len(evaluations) or (len(df) and df['id'].iat[-1] != evaluations[len(df) - 1]['id']):
+        df = build_evaluations_df(evaluations)
+    elif len(df) < len(evaluations):
+        df = pd.concat([df, build_evaluations_df(evaluations[len(df):])], ignore_index=True)
+        # concat falls back to object when the category sets differ
+        for column in EVALUATION_CATEGORY_COLUMNS:
+            df[column] = df[column].astype('category')
+    st.session_state._evaluations_df = df
+    return df
+
+@st.cache_data(show_spinner=False)
+def evaluations_to_csv(export_rows, _evaluations):
+    """CSV report bytes, re-serialized only when an exported field changes"""
+    # Written straight to bytes in chunks instead of building one str to encode
+    buffer = io.BytesIO()
+    pd.DataFrame(_evaluations, columns=EXPORT_COLUMNS).to_csv(buffer, index=False, encoding='utf-8', chunksize=CSV_CHUNK_ROWS)
+    return buffer.getvalue()
+
+@st.cache_resource
+def get_store():
+    """SQLite store shared across sessions so data survives reconnects; rows are keyed by owner"""
+    conn = sqlite3.connect(STORE_PATH, check_same_thread=False)
+    for table in STORE_TABLES:
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (row_id INTEGER PRIMARY KEY, id INTEGER, owner TEXT, data TEXT NOT NULL)")
+        if 'owner' not in {column[1] for column in conn.execute(f"PRAGMA table_info({table})")}:
+            # Rows stored before owners existed stay unreachable rather than visible to everyone
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN owner TEXT")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_owner ON {table} (owner, row_id)")
+    # Next id per table; ids only grow, so deletes never cause reuse
+    conn.execute("CREATE TABLE IF NOT EXISTS id_counters (name TEXT PRIMARY KEY, next_id INTEGER NOT NULL)")
+    for table in STORE_TABLES:
+        conn.execute(
+            f"INSERT OR IGNORE INTO id_counters (name, next_id) SELECT ?, COALESCE(MAX(id), 0) + 1 FROM {table}",
+            (table,)
+        )
+    conn.commit()
+    return conn
+
+@st.cache_resource
+def store_lock():
+    """Serializes use of the shared connection; every session's script runs on its own thread"""
+    return threading.Lock()
+
+@st.cache_resource
+def store_generations():
+    """Write count per (owner, table), shared by all sessions so each can tell when its lists are stale"""
+    return {}
+
+def mark_written(owner, table):
+    """Record a write so every session of this owner reloads the table; call with the store lock held"""
+    generations = store_generations()
+    generations[(owner, table)] = generations.get((owner, table), 0) + 1
+
+def store_owner():
+    """Private key of this visitor's rows, kept in the URL so a reconnect or bookmark finds the same data"""
+    owner = st.session_state.get('_store_owner')
+    if owner is None:
+        owner = st.query_params.get('owner') or secrets.token_urlsafe(16)
+        st.query_params['owner'] = owner
+        st.session_state._store_owner = owner
+    return owner
+
+def load_records(table):
+    """Load the current owner's stored records of a table in insertion order"""
+    with store_lock():
+        rows = get_store().execute(
+            f"SELECT data FROM {table} WHERE owner = ? ORDER BY row_id", (store_owner(),)
+        ).fetchall()
+    return [json_loads(data) for (data,) in rows]
+
+def save_records(table, records):
+    """Persist new records under store-assigned ids, without their derived lookup fields, then reload the session lists"""
+    if not records:
+        return
+    owner = store_owner()
+    conn = get_store()
+    with store_lock():
+        (first_id,) = conn.execute("SELECT next_id FROM id_counters WHERE name = ?", (table,)).fetchone()
+        for offset, record in enumerate(records):
+            record['id'] = first_id + offset
+        conn.execute("UPDATE id_counters SET next_id = ? WHERE name = ?", (first_id + len(records), table))
+        conn.executemany(
+            f"INSERT INTO {table} (id, owner, data) VALUES (?, ?, ?)",
+            [(record['id'], owner, json_dumps({k: v for k, v in record.items() if k not in DERIVED_FIELDS})) for record in records]
+        )
+        conn.commit()
+        mark_written(owner, table)
+    sync_session()
+
+def delete_record(table, record_id):
+    """Remove one of the current owner's records by its id, then reload the session lists"""
+    owner = store_owner()
+    conn = get_store()
+    with store_lock():
+        conn.execute(f"DELETE FROM {table} WHERE id = ? AND owner = ?", (record_id, owner))
+        conn.commit()
+        mark_written(owner, table)
+    sync_session()
+
+def clear_store():
+    """Remove every job, resume and evaluation of the current owner"""
+    owner = store_owner()
+    conn = get_store()
+    with store_lock():
+        for table in STORE_TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE owner = ?", (owner,))
+            mark_written(owner, table)
+        conn.commit()
+    sync_session()
+
+def bump_version(table):
+    """Mark a session list as changed so cached views of it are rebuilt"""
+    st.session_state[f"{table}_version"] = st.session_state.get(f"{table}_version", 0) + 1
+
+def records_by_id(table):
+    """Id -> record map for a session list, rebuilt only when the list's version changes"""
+    cache = st.session_state.setdefault('_id_cache', {})
+    version = st.session_state.get(f"{table}_version", 0)
+    if table not in cache or cache[table][0] != version:
+        cache[table] = (version, {record['id']: record for record in st.session_state[table]})
+    return cache[table][1]
+
+def load_jobs():
+    """Load stored jobs and rebuild their skill lookup fields"""
+    jobs = load_records('jobs')
+    for job in jobs:
+        job['required_set'] = frozenset(job['required_skills_norm'])
+        job['preferred_set'] = frozenset(job['preferred_skills_norm'])
+    return jobs
+
+def load_resumes():
+    """Load stored resumes and rebuild their skill lookup fields"""
+    resumes = load_records('resumes')
+    for resume in resumes:
+        resume['skills_set'] = frozenset(resume['skills'])
+        if 'content_hash' not in resume:
+            resume['content_hash'] = content_hash(resume['content'])
+    return resumes
+
+def sync_session():
+    """Reload the session lists that any session of this owner has written to since they were last loaded"""
+    owner = store_owner()
+    generations = store_generations()
+    loaded = st.session_state.setdefault('_store_generations', {})
+    for table in STORE_TABLES:
+        generation = generations.get((owner, table), 0)
+        if table in st.session_state and loaded.get(table) == generation:
+            continue
+        # Recorded before loading, so a write that lands meanwhile triggers another reload
+        loaded[table] = generation
+        if table == 'jobs':
+            st.session_state.jobs = load_jobs()
+        elif table == 'resumes':
+            st.session_state.resumes = load_resumes()
+        else:
+            evaluations = st.session_state.evaluations = load_records('evaluations')
+            st.session_state.score_sum = sum(e['score'] for e in evaluations)
+            # (job_id, resume_id) pairs already evaluated, for O(1) duplicate checks
+            st.session_state.eval_index = {(e['job_id'], e['resume_id']) for e in evaluations}
+        bump_version(table)
+
+def add_evaluation(evaluation):
+    """Store an evaluation; the running score total and pair index follow the reload"""
+    add_evaluations([evaluation])
+
+def add_evaluations(evaluations):
+    """Store a batch of evaluations with one store write"""
+    save_records('evaluations', evaluations)
+
+@st.fragment
+def render_existing_jobs():
+    """Existing Jobs tab; reruns on its own when its widgets change"""
+    st.subheader("Existing Jobs")
+    
+    if st.session_state.jobs:
+        jobs_df = pd.DataFrame(st.session_state.jobs)[
+            ['id', 'title', 'location', 'experience', 'required_skills', 'preferred_skills', 'created_date']
+        ]
+        # Skills found in the description are scored as required too, so they are listed alongside
+        jobs_df.insert(5, 'from_description', [description_skills(job) for job in st.session_state.jobs])
+        jobs_df.columns = ['ID', 'Title', 'Location', 'Experience', 'Required Skills', 'Required (From Description)',
+                           'Preferred Skills', 'Created']
+        st.dataframe(jobs_df, use_container_width=True, hide_index=True)
+        
+        # Actions apply to the job picked here instead of one widget tree per job
+        jobs_by_id = records_by_id('jobs')
+        col1, col2, col3 = st.columns([3, 1, 1])
+        with col1:
+            selected_job_id = st.selectbox(
+                "Select job:",
+                options=list(jobs_by_id),
+                format_func=lambda x: f"{jobs_by_id[x]['title']} (ID: {x})"
+            )
+        job = jobs_by_id[selected_job_id]
+        
+        with col2:
+            if st.button("Bulk Evaluate", key=f"bulk_{job['id']}", type="secondary"):
+                if st.session_state.resumes:
+                    new_evaluations = []
+                    evaluation_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+                    job_skills = job['required_set'] | job['preferred_set']
+                    # Only resumes not yet evaluated for this job are scored, in one matrix product
+                    pending = [r for r in st.session_state.resumes if (job['id'], r['id']) not in st.session_state.eval_index]
+                    scores = score_matrix([job], pending)[0].tolist() if pending else []
+                    for resume, score in zip(pending, scores):
+                        # Skill sets were built at upload; no text scan per pair
+                        resume_set = resume['skills_set']
+                        
+                        matched_skills = list(job_skills & resume_set)
+                        missing_skills = list(job['required_set'] - resume_set)
+                        
+                        verdict = get_verdict(score)
+                        feedback = generate_feedback(score, verdict, matched_skills, missing_skills)
+                        
+                        new_evaluations.append({
+                            "job_id": job['id'],
+                            "resume_id": resume['id'],
+                            "job_title": job['title'],
+                            "candidate_name": resume['name'],
+                            "score": score,
+                            "verdict": verdict,
+                            "matched_skills": matched_skills,
+                            "missing_skills": missing_skills,
+                            "feedback": feedback,
+                            "evaluation_date": evaluation_date
+                        })
+                    
+                    if new_evaluations:
+                        add_evaluations(new_evaluations)
+                    st.success(f"Bulk evaluation completed! Processed {len(new_evaluations)} new resumes.")
+                    st.rerun()
+                else:
+                    st.warning("No resumes available for evaluation.")
+            
+        with col3:
+            if st.button("Delete", key=f"delete_{job['id']}", type="secondary"):
+                delete_record('jobs', job['id'])
+                st.success("Job deleted successfully!")
+                st.rerun()
+    else:
+        st.info("No jobs created yet. Create your first job using the form above.")
+
+@st.fragment
+def render_manage_resumes():
+    """Manage Resumes tab; reruns on its own when its widgets change"""
+    st.subheader("Uploaded Resumes")
+    
+    if st.session_state.resumes:
+        # Add filter and search options
+        col_filter1, col_filter2 = st.columns(2)
+        with col_filter1:
+            search_term = st.text_input("Search resumes by name or email:", placeholder="Enter name or email...")
+        with col_filter2:
+            source_filter = st.selectbox("Filter by source:", 
+                                       options=["All"] + list(set([r.get('source', 'unknown') for r in st.session_state.resumes])))
+        
+        # Filter resumes based on search and filter criteria
+        filtered_resumes = st.session_state.resumes
+        
+        if search_term:
+            term = search_term.lower()
+            filtered_resumes = [r for r in filtered_resumes 
+                              if term in r['name'].lower() or term in r['email'].lower()]
+        
+        if source_filter != "All":
+            filtered_resumes = [r for r in filtered_resumes if r.get('source', 'unknown') == source_filter]
+        
+        st.write(f"**Showing {len(filtered_resumes)} of {len(st.session_state.resumes)} resumes**")
+        
+        if filtered_resumes:
+            resumes_df = pd.DataFrame(filtered_resumes)[['id', 'name', 'email', 'upload_date', 'source', 'skills']]
+            resumes_df.columns = ['ID', 'Name', 'Email', 'Upload Date', 'Source', 'Skills']
+            st.dataframe(resumes_df, use_container_width=True, hide_index=True)
+            
+            # Actions apply to the resume picked here instead of one widget tree per resume
+            resumes_by_id = {r['id']: r for r in filtered_resumes}
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                selected_resume_id = st.selectbox(
+                    "Select resume:",
+                    options=list(resumes_by_id),
+                    format_func=lambda x: f"{resumes_by_id[x]['name']} (ID: {x})"
+                )
+                resume = resumes_by_id[selected_resume_id]
+                
+                # Content preview
+                st.write("**Resume Preview:**")
+                st.text_area("Content Preview:", resume['preview'], height=100, disabled=True, key=f"preview_{resume['id']}")
+            
+            with col2:
+                # Action buttons
+                if st.button("View Full Content", key=f"view_{resume['id']}", help="View complete resume content"):
+                    with st.expander(f"Full Content - {resume['name']}", expanded=True):
+                        st.text_area("Complete Resume Content:", resume['content'], height=400, disabled=True)
+                
+                if st.button("Analyze Skills", key=f"analyze_{resume['id']}", help="Get detailed skill analysis"):
+                    with st.expander(f"Skill Analysis - {resume['name']}", expanded=True):
+                        if resume['skills']:
+                            # Group skills by type (this is a simple categorization)
+                            programming_skills = [s for s in resume['skills'] if any(prog in s.lower() for prog in ['python', 'java', 'javascript', 'react', 'angular', 'vue', 'node', 'php', 'c++', 'c#'])]
+                            data_skills = [s for s in resume['skills'] if any(data in s.lower() for data in ['sql', 'database', 'mongodb', 'mysql', 'postgresql', 'data', 'analytics'])]
+                            cloud_skills = [s for s in resume['skills'] if any(cloud in s.lower() for cloud in ['aws', 'azure', 'gcp', 'cloud', 'docker', 'kubernetes'])]
+                            other_skills = [s for s in resume['skills'] if s not in programming_skills + data_skills + cloud_skills]
+                            
+                            if programming_skills:
+                                st.write("**Programming & Development:**")
+                                st.write(", ".join(programming_skills))
+                            if data_skills:
+                                st.write("**Data & Databases:**")
+                                st.write(", ".join(data_skills))
+                            if cloud_skills:
+                                st.write("**Cloud & DevOps:**")
+                                st.write(", ".join(cloud_skills))
+                            if other_skills:
+                                st.write("**Other Skills:**")
+                                st.write(", ".join(other_skills))
+                        else:
+                            st.warning("No skills detected for analysis")
+                
+                st.markdown("---")
+                if st.button("Delete", key=f"delete_resume_{resume['id']}", type="secondary", help="Permanently delete this resume"):
+                    delete_record('resumes', resume['id'])
+                    st.success(f"Resume for {resume['name']} deleted successfully!")
+                    st.rerun()
+    else:
+        st.info("No resumes uploaded yet. Upload your first resume using the form above.")
+
+# Load session state from the persistent store, picking up other sessions' writes
+sync_session()
 
 # Page content
 if page == "Dashboard":
@@ -178,7 +759,7 @@ if page == "Dashboard":
         st.metric("Total Evaluations", len(st.session_state.evaluations))
     with col4:
         if st.session_state.evaluations:
-            avg_score = sum(e['score'] for e in st.session_state.evaluations) / len(st.session_state.evaluations)
+            avg_score = st.session_state.score_sum / len(st.session_state.evaluations)
             st.metric("Average Score", f"{avg_score:.1f}%")
         else:
             st.metric("Average Score", "N/A")
@@ -186,23 +767,14 @@ if page == "Dashboard":
     # Recent evaluations table
     if st.session_state.evaluations:
         st.subheader("Recent Evaluations")
-        df = pd.DataFrame(st.session_state.evaluations)
+        df = evaluations_frame()
         
         # Format the dataframe for better display
         display_df = df[['candidate_name', 'job_title', 'score', 'verdict']].copy()
         display_df.columns = ['Candidate', 'Job Title', 'Score (%)', 'Verdict']
         
         # Color code the verdicts
-        def highlight_verdict(val):
-            if val == 'High':
-                return 'background-color: #d4edda'
-            elif val == 'Medium':
-                return 'background-color: #fff3cd'
-            elif val == 'Low':
-                return 'background-color: #f8d7da'
-            return ''
-        
-        styled_df = display_df.style.applymap(highlight_verdict, subset=['Verdict'])
+        styled_df = display_df.style.apply(verdict_styles, subset=['Verdict'])
         st.dataframe(styled_df, use_container_width=True)
     else:
         st.info("No evaluations yet. Start by creating jobs and uploading resumes.")
@@ -246,88 +818,36 @@ elif page == "Job Management":
                     req_skills = [s.strip() for s in re.split(r'[,\n]', required_skills) if s.strip()]
                     pref_skills = [s.strip() for s in re.split(r'[,\n]', preferred_skills) if s.strip()]
                     
+                    # Skills named in the description count as required unless listed as preferred
+                    pref_norm = normalize_skills(pref_skills)
+                    req_norm = list(dict.fromkeys(
+                        normalize_skills(req_skills) +
+                        [skill for skill in extract_skills(job_description) if skill not in pref_norm]
+                    ))
+                    
                     # Create job object
                     job = {
-                        "id": len(st.session_state.jobs) + 1,
                         "title": job_title,
                         "location": location,
                         "experience": experience,
                         "description": job_description,
                         "required_skills": req_skills,
                         "preferred_skills": pref_skills,
+                        "required_skills_norm": req_norm,
+                        "preferred_skills_norm": pref_norm,
+                        "required_set": frozenset(req_norm),
+                        "preferred_set": frozenset(pref_norm),
                         "created_date": datetime.now().strftime("%Y-%m-%d %H:%M")
                     }
                     
-                    st.session_state.jobs.append(job)
+                    save_records('jobs', [job])
                     st.success(f"Job '{job_title}' created successfully! (ID: {job['id']})")
                     st.rerun()
                 else:
                     st.error("Please fill in all required fields (*)")
     
     with tab2:
-        st.subheader("Existing Jobs")
-        
-        if st.session_state.jobs:
-            for job in st.session_state.jobs:
-                with st.expander(f"{job['title']} (ID: {job['id']})"):
-                    col1, col2 = st.columns([3, 1])
-                    
-                    with col1:
-                        st.write(f"**Location:** {job.get('location', 'Not specified')}")
-                        st.write(f"**Experience:** {job.get('experience', 'Not specified')}")
-                        st.write(f"**Required Skills:** {', '.join(job['required_skills'])}")
-                        if job['preferred_skills']:
-                            st.write(f"**Preferred Skills:** {', '.join(job['preferred_skills'])}")
-                        st.write(f"**Created:** {job.get('created_date', 'Unknown')}")
-                    
-                    with col2:
-                        if st.button("Bulk Evaluate", key=f"bulk_{job['id']}", type="secondary"):
-                            if st.session_state.resumes:
-                                processed = 0
-                                for resume in st.session_state.resumes:
-                                    # Check if already evaluated
-                                    existing = any(e['job_id'] == job['id'] and e['resume_id'] == resume['id'] 
-                                                 for e in st.session_state.evaluations)
-                                    if not existing:
-                                        # Perform evaluation
-                                        resume_skills = extract_skills(resume['content'])
-                                        all_job_skills = job['required_skills'] + job['preferred_skills']
-                                        
-                                        matched_skills = list(set(all_job_skills) & set(resume_skills))
-                                        missing_skills = list(set(job['required_skills']) - set(resume_skills))
-                                        
-                                        score = calculate_score(job['required_skills'], resume_skills)
-                                        verdict = get_verdict(score)
-                                        feedback = generate_feedback(score, verdict, matched_skills, missing_skills)
-                                        
-                                        evaluation = {
-                                            "id": len(st.session_state.evaluations) + 1,
-                                            "job_id": job['id'],
-                                            "resume_id": resume['id'],
-                                            "job_title": job['title'],
-                                            "candidate_name": resume['name'],
-                                            "score": score,
-                                            "verdict": verdict,
-                                            "matched_skills": matched_skills,
-                                            "missing_skills": missing_skills,
-                                            "feedback": feedback,
-                                            "evaluation_date": datetime.now().strftime("%Y-%m-%d %H:%M")
-                                        }
-                                        
-                                        st.session_state.evaluations.append(evaluation)
-                                        processed += 1
-                                
-                                st.success(f"Bulk evaluation completed! Processed {processed} new resumes.")
-                                st.rerun()
-                            else:
-                                st.warning("No resumes available for evaluation.")
-                        
-                        if st.button("Delete", key=f"delete_{job['id']}", type="secondary"):
-                            st.session_state.jobs = [j for j in st.session_state.jobs if j['id'] != job['id']]
-                            st.success("Job deleted successfully!")
-                            st.rerun()
-        else:
-            st.info("No jobs created yet. Create your first job using the form above.")
+        render_existing_jobs()
 
 elif page == "Resume Upload":
     st.header("Resume Upload & Management")
@@ -382,41 +902,9 @@ elif page == "Resume Upload":
                     
                     try:
                         if file_extension == 'txt':
-                            resume_content = str(uploaded_file.read(), "utf-8")
-                        elif file_extension == 'pdf' and PDF_SUPPORT:
-                            # Save temporarily and extract text with better file handling
-                            try:
-                                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                                    tmp_file.write(uploaded_file.read())
-                                    tmp_file.flush()
-                                    tmp_file.close()  # Close file before reading
-                                    resume_content = extract_text_pdf(tmp_file.name)
-                                    resume_content = normalize_text(resume_content)
-                                    # Clean up temp file
-                                    try:
-                                        os.unlink(tmp_file.name)
-                                    except OSError:
-                                        pass  # File might already be deleted
-                            except Exception as e:
-                                st.error(f"Error processing PDF: {str(e)}")
-                                resume_content = ""
-                        elif file_extension == 'docx' and PDF_SUPPORT:
-                            # Save temporarily and extract text with better file handling
-                            try:
-                                with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-                                    tmp_file.write(uploaded_file.read())
-                                    tmp_file.flush()
-                                    tmp_file.close()  # Close file before reading
-                                    resume_content = extract_text_docx(tmp_file.name)
-                                    resume_content = normalize_text(resume_content)
-                                    # Clean up temp file
-                                    try:
-                                        os.unlink(tmp_file.name)
-                                    except OSError:
-                                        pass  # File might already be deleted
-                            except Exception as e:
-                                st.error(f"Error processing DOCX: {str(e)}")
-                                resume_content = ""
+                            resume_content = uploaded_file.getvalue().decode("utf-8", errors="replace")
+                        elif file_extension in ('pdf', 'docx') and PDF_SUPPORT:
+                            resume_content = parse_upload(uploaded_file, file_extension) or ""
                         else:
                             if not PDF_SUPPORT:
                                 st.warning("PDF and DOCX parsing requires additional libraries. Please use TXT files or paste text directly.")
@@ -494,29 +982,32 @@ elif page == "Resume Upload":
                         final_email = extracted_details['email']
                 
                 if final_name and final_email and resume_content:
+                    resume_hash = content_hash(resume_content)
                     # Extract skills from resume using appropriate method
                     if uploaded_file and uploaded_file.name.split('.')[-1].lower() in ['pdf', 'docx'] and PDF_SUPPORT:
                         # Use structured parsing for better skill extraction
                         parsed_data = parse_resume_structured(resume_content)
                         extracted_skills = parsed_data.get('skills', [])
                         if not extracted_skills:  # Fallback to basic extraction
-                            extracted_skills = extract_skills(resume_content)
+                            extracted_skills = resume_skills(resume_hash, resume_content)
                     else:
-                        extracted_skills = extract_skills(resume_content)
+                        extracted_skills = resume_skills(resume_hash, resume_content)
                     
                     # Create resume object
                     resume = {
-                        "id": len(st.session_state.resumes) + 1,
                         "name": final_name,
                         "email": final_email,
                         "content": resume_content,
+                        "content_hash": resume_hash,
+                        "preview": make_preview(resume_content),
                         "skills": extracted_skills,
+                        "skills_set": frozenset(extracted_skills),
                         "upload_date": datetime.now().strftime("%Y-%m-%d %H:%M"),
                         "phone": extracted_details.get('phone', '') if extracted_details else '',
                         "source": f"single_upload_{uploaded_file.name.split('.')[-1].lower() if uploaded_file else 'text'}"
                     }
                     
-                    st.session_state.resumes.append(resume)
+                    save_records('resumes', [resume])
                     st.success(f"Resume for {final_name} uploaded successfully! (ID: {resume['id']})")
                     
                     # Clear form after successful upload
@@ -556,102 +1047,7 @@ elif page == "Resume Upload":
                     st.error(f"Please provide the following required fields: {', '.join(missing_fields)}")
     
     with tab2:
-        st.subheader("Uploaded Resumes")
-        
-        if st.session_state.resumes:
-            # Add filter and search options
-            col_filter1, col_filter2 = st.columns(2)
-            with col_filter1:
-                search_term = st.text_input("Search resumes by name or email:", placeholder="Enter name or email...")
-            with col_filter2:
-                source_filter = st.selectbox("Filter by source:", 
-                                           options=["All"] + list(set([r.get('source', 'unknown') for r in st.session_state.resumes])))
-            
-            # Filter resumes based on search and filter criteria
-            filtered_resumes = st.session_state.resumes
-            
-            if search_term:
-                filtered_resumes = [r for r in filtered_resumes 
-                                  if search_term.lower() in r['name'].lower() or search_term.lower() in r['email'].lower()]
-            
-            if source_filter != "All":
-                filtered_resumes = [r for r in filtered_resumes if r.get('source', 'unknown') == source_filter]
-            
-            st.write(f"**Showing {len(filtered_resumes)} of {len(st.session_state.resumes)} resumes**")
-            
-            for resume in filtered_resumes:
-                with st.expander(f"{resume['name']} (ID: {resume['id']}) - {resume.get('source', 'unknown')}"):
-                    col1, col2 = st.columns([3, 1])
-                    
-                    with col1:
-                        # Basic information
-                        info_col1, info_col2 = st.columns(2)
-                        with info_col1:
-                            st.write(f"**Email:** {resume['email']}")
-                            st.write(f"**Upload Date:** {resume['upload_date']}")
-                            st.write(f"**Skills Count:** {len(resume['skills'])}")
-                        with info_col2:
-                            if resume.get('phone'):
-                                st.write(f"**Phone:** {resume['phone']}")
-                            st.write(f"**Source:** {resume.get('source', 'unknown')}")
-                            st.write(f"**Content Length:** {len(resume['content'])} chars")
-                        
-                        # Skills section
-                        if resume['skills']:
-                            st.write("**Skills Found:**")
-                            # Display skills in a more organized way
-                            skills_per_row = 4
-                            skills = resume['skills']
-                            for i in range(0, len(skills), skills_per_row):
-                                skill_cols = st.columns(skills_per_row)
-                                for j, skill in enumerate(skills[i:i+skills_per_row]):
-                                    with skill_cols[j]:
-                                        st.write(f"• {skill}")
-                        else:
-                            st.warning("No skills found")
-                        
-                        # Content preview
-                        st.write("**Resume Preview:**")
-                        preview = resume['content'][:300] + "..." if len(resume['content']) > 300 else resume['content']
-                        st.text_area("Content Preview:", preview, height=100, disabled=True, key=f"preview_{resume['id']}")
-                    
-                    with col2:
-                        # Action buttons
-                        if st.button("View Full Content", key=f"view_{resume['id']}", help="View complete resume content"):
-                            with st.expander(f"Full Content - {resume['name']}", expanded=True):
-                                st.text_area("Complete Resume Content:", resume['content'], height=400, disabled=True)
-                        
-                        if st.button("Analyze Skills", key=f"analyze_{resume['id']}", help="Get detailed skill analysis"):
-                            with st.expander(f"Skill Analysis - {resume['name']}", expanded=True):
-                                if resume['skills']:
-                                    # Group skills by type (this is a simple categorization)
-                                    programming_skills = [s for s in resume['skills'] if any(prog in s.lower() for prog in ['python', 'java', 'javascript', 'react', 'angular', 'vue', 'node', 'php', 'c++', 'c#'])]
-                                    data_skills = [s for s in resume['skills'] if any(data in s.lower() for data in ['sql', 'database', 'mongodb', 'mysql', 'postgresql', 'data', 'analytics'])]
-                                    cloud_skills = [s for s in resume['skills'] if any(cloud in s.lower() for cloud in ['aws', 'azure', 'gcp', 'cloud', 'docker', 'kubernetes'])]
-                                    other_skills = [s for s in resume['skills'] if s not in programming_skills + data_skills + cloud_skills]
-                                    
-                                    if programming_skills:
-                                        st.write("**Programming & Development:**")
-                                        st.write(", ".join(programming_skills))
-                                    if data_skills:
-                                        st.write("**Data & Databases:**")
-                                        st.write(", ".join(data_skills))
-                                    if cloud_skills:
-                                        st.write("**Cloud & DevOps:**")
-                                        st.write(", ".join(cloud_skills))
-                                    if other_skills:
-                                        st.write("**Other Skills:**")
-                                        st.write(", ".join(other_skills))
-                                else:
-                                    st.warning("No skills detected for analysis")
-                        
-                        st.markdown("---")
-                        if st.button("Delete", key=f"delete_resume_{resume['id']}", type="secondary", help="Permanently delete this resume"):
-                            st.session_state.resumes = [r for r in st.session_state.resumes if r['id'] != resume['id']]
-                            st.success(f"Resume for {resume['name']} deleted successfully!")
-                            st.rerun()
-        else:
-            st.info("No resumes uploaded yet. Upload your first resume using the form above.")
+        render_manage_resumes()
 
 elif page == "Bulk Operations":
     st.header("Bulk Operations & Advanced Processing")
@@ -692,6 +1088,7 @@ elif page == "Bulk Operations":
         
         if st.button("Process Bulk Upload", type="primary"):
             processed_count = 0
+            new_resumes = []
             
             # Process uploaded files
             if uploaded_files:
@@ -701,40 +1098,10 @@ elif page == "Bulk Operations":
                         file_extension = uploaded_file.name.split('.')[-1].lower()
                         
                         if file_extension == 'txt':
-                            content = str(uploaded_file.read(), "utf-8")
-                        elif file_extension == 'pdf':
-                            # Save temporarily and extract text with better file handling
-                            try:
-                                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                                    tmp_file.write(uploaded_file.read())
-                                    tmp_file.flush()
-                                    tmp_file.close()  # Close file before reading
-                                    content = extract_text_pdf(tmp_file.name)
-                                    content = normalize_text(content)
-                                    # Clean up temp file
-                                    try:
-                                        os.unlink(tmp_file.name)
-                                    except OSError:
-                                        pass  # File might already be deleted
-                            except Exception as e:
-                                st.error(f"Error processing PDF: {str(e)}")
-                                continue
-                        elif file_extension == 'docx':
-                            # Save temporarily and extract text with better file handling
-                            try:
-                                with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-                                    tmp_file.write(uploaded_file.read())
-                                    tmp_file.flush()
-                                    tmp_file.close()  # Close file before reading
-                                    content = extract_text_docx(tmp_file.name)
-                                    content = normalize_text(content)
-                                    # Clean up temp file
-                                    try:
-                                        os.unlink(tmp_file.name)
-                                    except OSError:
-                                        pass  # File might already be deleted
-                            except Exception as e:
-                                st.error(f"Error processing DOCX: {str(e)}")
+                            content = uploaded_file.getvalue().decode("utf-8", errors="replace")
+                        elif file_extension in ('pdf', 'docx'):
+                            content = parse_upload(uploaded_file, file_extension)
+                            if content is None:
                                 continue
                         else:
                             st.error(f"Unsupported file type: {file_extension}")
@@ -757,29 +1124,32 @@ elif page == "Bulk Operations":
                         if auto_extract_emails and candidate_details['email']:
                             email = candidate_details['email']
                         
+                        resume_hash = content_hash(content)
                         # Extract skills using the structured parser for better results
                         if file_extension in ['pdf', 'docx']:
                             # Use structured parsing for better skill extraction
                             parsed_data = parse_resume_structured(content)
                             skills = parsed_data.get('skills', [])
                             if not skills:  # Fallback to basic extraction
-                                skills = extract_skills(content)
+                                skills = resume_skills(resume_hash, content)
                         else:
-                            skills = extract_skills(content)
+                            skills = resume_skills(resume_hash, content)
                         
                         # Create resume object
                         resume = {
-                            "id": len(st.session_state.resumes) + i + 1,
                             "name": name,
                             "email": email,
                             "content": content,
+                            "content_hash": resume_hash,
+                            "preview": make_preview(content),
                             "skills": skills,
+                            "skills_set": frozenset(skills),
                             "upload_date": datetime.now().strftime("%Y-%m-%d %H:%M"),
                             "source": f"bulk_upload_{file_extension}",
                             "phone": candidate_details.get('phone', '')
                         }
                         
-                        st.session_state.resumes.append(resume)
+                        new_resumes.append(resume)
                         processed_count += 1
                         
                         # Show progress for each file
@@ -792,7 +1162,7 @@ elif page == "Bulk Operations":
             
             # Process bulk text
             if bulk_text.strip():
-                resume_texts = [text.strip() for text in bulk_text.split('---') if text.strip()]
+                resume_texts = list(filter(None, (t.strip() for t in _BULK_SEP_RE.split(bulk_text))))
                 
                 for i, content in enumerate(resume_texts):
                     try:
@@ -801,9 +1171,9 @@ elif page == "Bulk Operations":
                         email = f"candidate{len(st.session_state.resumes) + i + 1}@email.com"
                         
                         if auto_extract_names:
-                            lines = content.strip().split('\n')
-                            if lines and len(lines[0].split()) <= 4:
-                                name = lines[0].strip()
+                            first_line = content.partition('\n')[0].strip()
+                            if len(first_line.split()) <= 4:
+                                name = first_line
                         
                         if auto_extract_emails:
                             email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
@@ -812,31 +1182,36 @@ elif page == "Bulk Operations":
                                 email = emails[0]
                         
                         # Extract skills
-                        skills = extract_skills(content)
+                        resume_hash = content_hash(content)
+                        skills = resume_skills(resume_hash, content)
                         
                         # Create resume object
                         resume = {
-                            "id": len(st.session_state.resumes) + processed_count + i + 1,
                             "name": name,
                             "email": email,
                             "content": content,
+                            "content_hash": resume_hash,
+                            "preview": make_preview(content),
                             "skills": skills,
+                            "skills_set": frozenset(skills),
                             "upload_date": datetime.now().strftime("%Y-%m-%d %H:%M"),
                             "source": "bulk_text"
                         }
                         
-                        st.session_state.resumes.append(resume)
+                        new_resumes.append(resume)
                         processed_count += 1
                         
                     except Exception as e:
                         st.error(f"Error processing resume {i+1}: {str(e)}")
             
+            save_records('resumes', new_resumes)
+            
             if processed_count > 0:
                 st.success(f"Successfully processed {processed_count} resumes!")
                 
                 # Display summary of processed files
                 st.subheader("Processing Summary")
-                recent_resumes = st.session_state.resumes[-processed_count:]
+                recent_resumes = new_resumes
                 
                 summary_data = []
                 for resume in recent_resumes:
@@ -905,23 +1280,22 @@ elif page == "Bulk Operations":
             # Smart matching algorithm
             if st.button("Run Smart Matching", type="primary"):
                 matches_found = 0
+                all_scores = score_matrix(st.session_state.jobs, st.session_state.resumes)
                 
-                for job in st.session_state.jobs:
+                for job, job_scores in zip(st.session_state.jobs, all_scores):
                     st.write(f"**Matching for: {job['title']}**")
                     
                     job_matches = []
                     
-                    for resume in st.session_state.resumes:
-                        # Calculate score
-                        skill_score = calculate_score(job['required_skills'], resume['skills'])
-                        
-                        if skill_score >= min_score_threshold:
-                            job_matches.append({
-                                'resume': resume,
-                                'score': skill_score,
-                                'matched_skills': list(set(job['required_skills']) & set(resume['skills'])),
-                                'missing_skills': list(set(job['required_skills']) - set(resume['skills']))
-                            })
+                    # Skill lists are only built for candidates above the threshold
+                    for resume_index in np.flatnonzero(job_scores >= min_score_threshold):
+                        resume = st.session_state.resumes[resume_index]
+                        job_matches.append({
+                            'resume': resume,
+                            'score': int(job_scores[resume_index]),
+                            'matched_skills': sorted(job['required_set'] & resume['skills_set']),
+                            'missing_skills': sorted(job['required_set'] - resume['skills_set'])
+                        })
                     
                     # Sort by score
                     job_matches.sort(key=lambda x: x['score'], reverse=True)
@@ -972,21 +1346,24 @@ elif page == "Bulk Operations":
                 
                 progress_bar = st.progress(0)
                 total_combinations = len(st.session_state.jobs) * len(st.session_state.resumes)
+                progress_step = max(1, total_combinations // 100)
                 current_combination = 0
+                all_scores = score_matrix(st.session_state.jobs, st.session_state.resumes)
+                new_evaluations = []
+                evaluation_date = datetime.now().strftime("%Y-%m-%d %H:%M")
                 
-                for job in st.session_state.jobs:
+                for job, job_scores in zip(st.session_state.jobs, all_scores):
                     job_results = []
                     
-                    for resume in st.session_state.resumes:
+                    for resume, score in zip(st.session_state.resumes, job_scores.tolist()):
                         current_combination += 1
-                        progress_bar.progress(current_combination / total_combinations)
+                        if current_combination % progress_step == 0:
+                            progress_bar.progress(current_combination / total_combinations)
                         
-                        # Calculate comprehensive score
-                        score = calculate_score(job['required_skills'], resume['skills'])
-                        verdict = get_verdict(score)
+                        matched_skills = sorted(job['required_set'] & resume['skills_set'])
+                        missing_skills = sorted(job['required_set'] - resume['skills_set'])
                         
-                        matched_skills = list(set(job['required_skills']) & set(resume['skills']))
-                        missing_skills = list(set(job['required_skills']) - set(resume['skills']))
+                        verdict = get_verdict(score)
                         
                         result = {
                             'job_title': job['title'],
@@ -1002,10 +1379,9 @@ elif page == "Bulk Operations":
                         
                         job_results.append(result)
                         
-                        # Save to evaluations if requested
-                        if save_results:
-                            evaluation = {
-                                "id": len(st.session_state.evaluations) + current_combination,
+                        # Save to evaluations if requested, skipping pairs already evaluated
+                        if save_results and (job['id'], resume['id']) not in st.session_state.eval_index:
+                            new_evaluations.append({
                                 "job_id": job['id'],
                                 "resume_id": resume['id'],
                                 "job_title": job['title'],
@@ -1015,17 +1391,8 @@ elif page == "Bulk Operations":
                                 "matched_skills": matched_skills,
                                 "missing_skills": missing_skills,
                                 "feedback": result.get('feedback', ''),
-                                "evaluation_date": datetime.now().strftime("%Y-%m-%d %H:%M")
-                            }
-                            
-                            # Check if evaluation already exists
-                            existing = any(
-                                e['job_id'] == job['id'] and e['resume_id'] == resume['id']
-                                for e in st.session_state.evaluations
-                            )
-                            
-                            if not existing:
-                                st.session_state.evaluations.append(evaluation)
+                                "evaluation_date": evaluation_date
+                            })
                     
                     # Sort job results by score
                     job_results.sort(key=lambda x: x['score'], reverse=True)
@@ -1034,32 +1401,41 @@ elif page == "Bulk Operations":
                         'results': job_results[:top_n]  # Top N candidates
                     })
                 
+                if new_evaluations:
+                    add_evaluations(new_evaluations)
+                
+                progress_bar.progress(1.0)
                 progress_bar.empty()
                 
                 # Display results
                 st.subheader("Auto-Scoring Results")
                 
+                # Rows are tuples in a list sized up front for all jobs
+                results_data = [None] * sum(len(job_result['results']) for job_result in scoring_results)
+                row = 0
                 for job_result in scoring_results:
-                    st.write(f"**{job_result['job']['title']}** - Top {len(job_result['results'])} Candidates:")
-                    
-                    if job_result['results']:
-                        results_data = []
-                        for result in job_result['results']:
-                            results_data.append({
-                                'Rank': len(results_data) + 1,
-                                'Candidate': result['candidate_name'],
-                                'Score': f"{result['score']}%",
-                                'Verdict': result['verdict'],
-                                'Matched Skills': len(result['matched_skills']),
-                                'Missing Skills': len(result['missing_skills'])
-                            })
-                        
-                        results_df = pd.DataFrame(results_data)
-                        st.dataframe(results_df, use_container_width=True)
-                    else:
-                        st.write("No candidates found.")
-                    
-                    st.markdown("---")
+                    for rank, result in enumerate(job_result['results'], 1):
+                        results_data[row] = (
+                            job_result['job']['title'],
+                            rank,
+                            result['candidate_name'],
+                            result['score'],
+                            result['verdict'],
+                            len(result['matched_skills']),
+                            len(result['missing_skills'])
+                        )
+                        row += 1
+                
+                if results_data:
+                    # One table for all jobs; Score stays numeric and is formatted as a percentage
+                    st.dataframe(
+                        pd.DataFrame.from_records(results_data, columns=AUTO_SCORING_COLUMNS),
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={'Score': st.column_config.NumberColumn('Score', format="%d%%")}
+                    )
+                else:
+                    st.write("No candidates found.")
                 
                 st.success(f"Auto-scoring completed for {len(st.session_state.jobs)} jobs and {len(st.session_state.resumes)} resumes!")
         else:
@@ -1075,31 +1451,33 @@ elif page == "AI Assistant":
         st.subheader("Advanced Resume Analysis")
         
         if st.session_state.resumes:
-            selected_resume_id = st.selectbox(
-                "Select Resume for Analysis",
-                options=[r['id'] for r in st.session_state.resumes],
-                format_func=lambda x: next(r['name'] for r in st.session_state.resumes if r['id'] == x)
-            )
+            # Changing the selection does not rerun the page until the form is submitted
+            resumes_by_id = records_by_id('resumes')
+            with st.form("analyze_resume"):
+                selected_resume_id = st.selectbox(
+                    "Select Resume for Analysis",
+                    options=list(resumes_by_id),
+                    format_func=lambda x: resumes_by_id[x]['name']
+                )
+                analyze = st.form_submit_button("Analyze Resume", type="primary")
             
-            selected_resume = next(r for r in st.session_state.resumes if r['id'] == selected_resume_id)
+            # Keep the last analysis on screen across unrelated reruns
+            if analyze:
+                st.session_state.analyzed_resume_id = selected_resume_id
+            selected_resume = resumes_by_id.get(st.session_state.get('analyzed_resume_id'))
             
-            if st.button("Analyze Resume", type="primary"):
+            if selected_resume:
                 st.subheader("AI Analysis Results")
                 
                 # Skill analysis
-                resume_skills = selected_resume['skills']
-                all_job_skills = []
-                for job in st.session_state.jobs:
-                    all_job_skills.extend(job['required_skills'])
-                
-                skill_demand = {}
-                for skill in set(all_job_skills):
-                    skill_demand[skill] = all_job_skills.count(skill)
+                candidate_skills = selected_resume['skills']
+                resume_set = selected_resume['skills_set']
+                skill_demand = compute_skill_demand(job_skills_key(st.session_state.jobs))
                 
                 # Calculate skill value
-                valuable_skills = [skill for skill in resume_skills if skill in skill_demand]
+                valuable_skills = [skill for skill in candidate_skills if skill in skill_demand]
                 missing_valuable_skills = [skill for skill, demand in skill_demand.items() 
-                                         if demand > 1 and skill not in resume_skills]
+                                         if demand > 1 and skill not in resume_set]
                 
                 col1, col2 = st.columns(2)
                 
@@ -1114,8 +1492,7 @@ elif page == "AI Assistant":
                 
                 with col2:
                     st.markdown("**Recommended Skills to Learn:**")
-                    for skill in sorted(missing_valuable_skills, 
-                                      key=lambda x: skill_demand[x], reverse=True)[:5]:
+                    for skill in heapq.nlargest(5, missing_valuable_skills, key=skill_demand.__getitem__):
                         demand_count = skill_demand[skill]
                         st.warning(f"{skill} (Demand: {demand_count} jobs)")
                     
@@ -1125,16 +1502,8 @@ elif page == "AI Assistant":
                 # Resume strength analysis
                 st.subheader("Resume Completeness Analysis")
                 
-                content = selected_resume['content'].lower()
-                
                 # Check for key sections
-                sections_check = {
-                    'Experience/Work History': any(word in content for word in ['experience', 'work', 'employment', 'position']),
-                    'Education': any(word in content for word in ['education', 'degree', 'university', 'college']),
-                    'Skills': any(word in content for word in ['skills', 'technical', 'proficient']),
-                    'Projects': any(word in content for word in ['project', 'portfolio', 'github']),
-                    'Certifications': any(word in content for word in ['certification', 'certified', 'license'])
-                }
+                sections_check = check_resume_sections(selected_resume['content'])
                 
                 strength_score = sum(sections_check.values()) / len(sections_check) * 100
                 
@@ -1157,22 +1526,10 @@ elif page == "AI Assistant":
                 st.subheader("AI-Powered Insights")
                 
                 # Market demand analysis
-                all_required_skills = []
-                for job in st.session_state.jobs:
-                    all_required_skills.extend(job['required_skills'])
-                
-                skill_demand_count = {}
-                for skill in set(all_required_skills):
-                    skill_demand_count[skill] = all_required_skills.count(skill)
+                skill_demand_count = compute_skill_demand(job_skills_key(st.session_state.jobs))
                 
                 # Supply analysis
-                all_candidate_skills = []
-                for resume in st.session_state.resumes:
-                    all_candidate_skills.extend(resume['skills'])
-                
-                skill_supply_count = {}
-                for skill in set(all_candidate_skills):
-                    skill_supply_count[skill] = all_candidate_skills.count(skill)
+                skill_supply_count = compute_skill_supply(resume_skills_key(st.session_state.resumes))
                 
                 # Market gap analysis
                 st.markdown("**Market Gap Analysis:**")
@@ -1184,11 +1541,11 @@ elif page == "AI Assistant":
                         gap_ratio = demand / max(supply, 1)
                         high_demand_low_supply.append((skill, demand, supply, gap_ratio))
                 
-                high_demand_low_supply.sort(key=lambda x: x[3], reverse=True)
+                high_demand_low_supply = heapq.nlargest(5, high_demand_low_supply, key=lambda x: x[3])
                 
                 if high_demand_low_supply:
                     st.markdown("**Skills in High Demand but Low Supply:**")
-                    for skill, demand, supply, ratio in high_demand_low_supply[:5]:
+                    for skill, demand, supply, ratio in high_demand_low_supply:
                         st.error(f"{skill}: {demand} jobs need it, only {supply} candidates have it (Gap: {ratio:.1f}x)")
                     
                     st.markdown("**Recommendations:**")
@@ -1202,10 +1559,10 @@ elif page == "AI Assistant":
                 st.markdown("**Top Performing Candidates:**")
                 
                 if st.session_state.evaluations:
-                    eval_df = pd.DataFrame(st.session_state.evaluations)
+                    eval_df = evaluations_frame()
                     top_performers = eval_df.nlargest(5, 'score')
                     
-                    for _, performer in top_performers.iterrows():
+                    for performer in top_performers[['candidate_name', 'score', 'job_title']].to_dict('records'):
                         st.success(f"{performer['candidate_name']}: {performer['score']}% for {performer['job_title']}")
                 else:
                     st.info("Run evaluations to see top performers")
@@ -1222,20 +1579,25 @@ elif page == "Evaluation":
             
             with col1:
                 # Job selection
-                job_options = {f"{job['title']} (ID: {job['id']})": job for job in st.session_state.jobs}
-                selected_job_key = st.selectbox("Select Job Position:", list(job_options.keys()))
-                selected_job = job_options[selected_job_key]
+                jobs_by_id = records_by_id('jobs')
+                selected_job_id = st.selectbox("Select Job Position:", list(jobs_by_id),
+                                               format_func=lambda x: f"{jobs_by_id[x]['title']} (ID: {x})")
+                selected_job = jobs_by_id[selected_job_id]
                 
                 # Show job details
                 st.write(f"**Required Skills:** {', '.join(selected_job['required_skills'])}")
+                from_description = description_skills(selected_job)
+                if from_description:
+                    st.write(f"**Required (From Description):** {', '.join(from_description)}")
                 if selected_job['preferred_skills']:
                     st.write(f"**Preferred Skills:** {', '.join(selected_job['preferred_skills'])}")
             
             with col2:
                 # Resume selection
-                resume_options = {f"{resume['name']} (ID: {resume['id']})": resume for resume in st.session_state.resumes}
-                selected_resume_key = st.selectbox("Select Candidate:", list(resume_options.keys()))
-                selected_resume = resume_options[selected_resume_key]
+                resumes_by_id = records_by_id('resumes')
+                selected_resume_id = st.selectbox("Select Candidate:", list(resumes_by_id),
+                                                  format_func=lambda x: f"{resumes_by_id[x]['name']} (ID: {x})")
+                selected_resume = resumes_by_id[selected_resume_id]
                 
                 # Show candidate skills
                 st.write(f"**Candidate Skills:** {', '.join(selected_resume['skills'])}")
@@ -1244,20 +1606,24 @@ elif page == "Evaluation":
             
             if submitted:
                 # Perform evaluation
-                job_skills = selected_job['required_skills'] + selected_job['preferred_skills']
-                resume_skills = selected_resume['skills']
-                
-                matched_skills = list(set(job_skills) & set(resume_skills))
-                missing_required = list(set(selected_job['required_skills']) - set(resume_skills))
-                missing_preferred = list(set(selected_job['preferred_skills']) - set(resume_skills))
-                
-                score = calculate_score(selected_job['required_skills'], resume_skills)
+                required_set = selected_job['required_set']
+                preferred_set = selected_job['preferred_set']
+                job_skills = required_set | preferred_set
+                resume_set = selected_resume['skills_set']
+
+                # One difference per group; matches follow from what is left
+                missing_required_set = required_set - resume_set
+                missing_preferred_set = preferred_set - resume_set
+                matched_skills = list(job_skills - missing_required_set - missing_preferred_set)
+                missing_required = list(missing_required_set)
+                missing_preferred = list(missing_preferred_set)
+
+                score = match_score(len(required_set) - len(missing_required_set), len(required_set))
                 verdict = get_verdict(score)
                 feedback = generate_feedback(score, verdict, matched_skills, missing_required)
                 
                 # Save evaluation
                 evaluation = {
-                    "id": len(st.session_state.evaluations) + 1,
                     "job_id": selected_job['id'],
                     "resume_id": selected_resume['id'],
                     "job_title": selected_job['title'],
@@ -1270,7 +1636,7 @@ elif page == "Evaluation":
                     "evaluation_date": datetime.now().strftime("%Y-%m-%d %H:%M")
                 }
                 
-                st.session_state.evaluations.append(evaluation)
+                add_evaluation(evaluation)
                 
                 # Display results
                 st.success("Evaluation completed successfully!")
@@ -1339,69 +1705,54 @@ elif page == "Analytics":
     st.header("Analytics & Reports")
     
     if st.session_state.evaluations:
-        # Create analytics dataframe
-        df = pd.DataFrame(st.session_state.evaluations)
+        # Aggregates are recomputed only when the evaluations change
+        analytics = compute_analytics(evaluations_key(st.session_state.evaluations))
         
         # Summary statistics
         st.subheader("Summary Statistics")
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Evaluations", len(df))
+            st.metric("Total Evaluations", analytics['total'])
         with col2:
-            avg_score = df['score'].mean()
-            st.metric("Average Score", f"{avg_score:.1f}%")
+            st.metric("Average Score", f"{analytics['average']:.1f}%")
         with col3:
-            high_count = len(df[df['verdict'] == 'High'])
-            st.metric("High Matches", high_count)
+            st.metric("High Matches", analytics['high'])
         with col4:
-            low_count = len(df[df['verdict'] == 'Low'])
-            st.metric("Low Matches", low_count)
+            st.metric("Low Matches", analytics['low'])
         
         # Charts
         col1, col2 = st.columns(2)
         
         with col1:
             st.subheader("Score Distribution")
-            score_ranges = pd.cut(df['score'], bins=[0, 40, 60, 80, 100], labels=['0-40%', '41-60%', '61-80%', '81-100%'])
-            score_counts = score_ranges.value_counts()
-            st.bar_chart(score_counts)
+            st.bar_chart(analytics['score_counts'])
         
         with col2:
             st.subheader("Verdict Distribution")
-            verdict_counts = df['verdict'].value_counts()
-            st.bar_chart(verdict_counts)
+            st.bar_chart(analytics['verdict_counts'])
         
-        # Job-wise analysis
-        if len(df['job_title'].unique()) > 1:
+        if analytics['job_stats'] is not None:
             st.subheader("Performance by Job Position")
-            job_stats = df.groupby('job_title')['score'].agg(['mean', 'count']).round(1)
-            job_stats.columns = ['Average Score', 'Number of Evaluations']
-            st.dataframe(job_stats, use_container_width=True)
+            st.dataframe(analytics['job_stats'], use_container_width=True)
         
         # Detailed evaluation history
         st.subheader("Evaluation History")
-        display_df = df[['evaluation_date', 'candidate_name', 'job_title', 'score', 'verdict']].copy()
-        display_df.columns = ['Date', 'Candidate', 'Job', 'Score (%)', 'Verdict']
-        display_df = display_df.sort_values('Date', ascending=False)
+        display_df = analytics['history']
         
-        # Add color coding
-        def highlight_verdict(val):
-            if val == 'High':
-                return 'background-color: #d4edda'
-            elif val == 'Medium':
-                return 'background-color: #fff3cd'
-            elif val == 'Low':
-                return 'background-color: #f8d7da'
-            return ''
+        # Only the current page is styled and sent to the browser
+        page_count = max(1, -(-len(display_df) // HISTORY_PAGE_SIZE))
+        history_page = st.number_input("Page", min_value=1, max_value=page_count, value=1) if page_count > 1 else 1
+        page_df = display_df.iloc[(history_page - 1) * HISTORY_PAGE_SIZE:history_page * HISTORY_PAGE_SIZE]
         
-        styled_df = display_df.style.applymap(highlight_verdict, subset=['Verdict'])
+        # Add color coding
+        styled_df = page_df.style.apply(verdict_styles, subset=['Verdict'])
         st.dataframe(styled_df, use_container_width=True)
         
         # Export functionality
         st.subheader("Export Data")
         if st.button("Download Evaluation Report (CSV)"):
-            csv = df.to_csv(index=False)
+            csv = evaluations_to_csv(export_key(st.session_state.evaluations), st.session_state.evaluations)
             st.download_button(
                 label="Download CSV",
                 data=csv,
@@ -1416,18 +1767,18 @@ elif page == "Analytics":
 with st.sidebar:
     st.markdown("---")
     st.subheader("System Information")
-    st.write(f"Jobs: {len(st.session_state.jobs)}")
-    st.write(f"Resumes: {len(st.session_state.resumes)}")
-    st.write(f"Evaluations: {len(st.session_state.evaluations)}")
+    job_count = len(st.session_state.jobs)
+    resume_count = len(st.session_state.resumes)
+    evaluation_count = len(st.session_state.evaluations)
+    st.markdown(f"Jobs: {job_count}  \nResumes: {resume_count}  \nEvaluations: {evaluation_count}")
     
     st.markdown("---")
     st.subheader("Data Management")
     
     if st.button("Clear All Data", type="secondary"):
         if st.session_state.get('confirm_clear', False):
-            st.session_state.jobs = []
-            st.session_state.resumes = []
-            st.session_state.evaluations = []
+            clear_store()
+            st.cache_data.clear()
             st.session_state.confirm_clear = False
             st.success("All data cleared!")
             st.rerun()